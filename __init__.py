@@ -1,10 +1,16 @@
 # Check if addon is being reloaded
 # This also allows script.reload() to reload the addon
+# sync_handler is imported by the enable operator the first time sync is enabled
 if "operator_sync_view" not in locals():
-    from . import sync_handler, ui, operator_sync_view, msgbus, preferences, handlers
+    from . import ui, operator_sync_view, msgbus, preferences, handlers
 else:
     import importlib
-    sync_handler = importlib.reload(sync_handler)
+    if "sync_handler" in locals():
+        # Modules used by sync_handler are reloaded first so it picks up their new versions
+        for helper_module in (view_state, space_map, scheduler, navigation_lod, transport, stats, config,
+                              trace):
+            importlib.reload(helper_module)
+        sync_handler = importlib.reload(sync_handler)
     ui = importlib.reload(ui)
     operator_sync_view = importlib.reload(operator_sync_view)
     msgbus = importlib.reload(msgbus)
@@ -0,0 +1,7 @@
+"""
+Headless benchmarks for Sync View, run from the addon's root directory with `python -m benchmarks`.
+
+The addon is driven through standin_bpy, a stand-in for the parts of bpy it uses, so no Blender
+installation, GPU or UI is needed. Numbers are for the addon's Python code only and are meant to be
+compared between versions, not to predict frame times inside Blender.
+"""
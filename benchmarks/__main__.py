@@ -0,0 +1,26 @@
+import argparse
+import sys
+
+from . import bench_allocations, bench_startup, bench_sync_handler, bench_transport, replay
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Sync View benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    bench_sync_handler.add_arguments(subparsers.add_parser("sync", help="hot path of SyncDrawHandler"))
+    bench_startup.add_arguments(subparsers.add_parser("startup", help="addon registration and file loads"))
+    bench_allocations.add_arguments(subparsers.add_parser("allocations", help="memory retained by the sync path"))
+    bench_transport.add_arguments(subparsers.add_parser("transport", help="sync between instances over loopback"))
+    replay.add_arguments(subparsers.add_parser("replay", help="replay a recorded session trace"))
+    arguments = parser.parse_args()
+    return {
+        "sync": bench_sync_handler.main,
+        "startup": bench_startup.main,
+        "allocations": bench_allocations.main,
+        "transport": bench_transport.main,
+        "replay": replay.main,
+    }[arguments.benchmark](arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Memory retained and transiently allocated by the steady-state sync path, measured with tracemalloc.
+
+Objects that survive a frame are what the cyclic garbage collector counts towards a collection, so a sync path
+that retains nothing per frame doesn't trigger collections during long navigations or sculpt strokes.
+Draws that sync nothing, in the active viewport while its view is unchanged or in a synced one, run on every redraw
+and should not allocate at all. Draws that sync a change should allocate no more than the packet they write.
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+from typing import Dict
+
+from . import layouts
+from .bench_sync_handler import ROTATIONS, SYNC_MODES
+
+# Bytes each path may allocate per frame, even temporarily. Syncing a change only allocates the packet that is
+# written to every target, building it from a list of the buffer's values already exceeds the budget.
+TRANSIENT_BUDGETS = {"changed": 384, "unchanged": 0, "target": 0}
+# Interpreter caches can retain a few blocks once, anything more is retained per frame
+RETAINED_BLOCKS_LIMIT = 16
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+def _is_addon_frame(filename: str) -> bool:
+    return filename.startswith(layouts.ADDON_PATH) and not filename.startswith(BENCHMARKS_PATH)
+
+
+def measure(function, frames: int, prepare=None) -> Dict[str, int]:
+    """
+    Call function once per frame after a warm up, and count what the addon's code retained over the frames.
+    Tracing starts a span of frames before measuring, so objects that are replaced every frame, like the
+    latest view packet, are already traced when the measured span starts.
+    Transient allocations are the most memory any frame allocated above what was allocated before it, which
+    includes allocations of the stand-in bpy. prepare is called before every frame, outside of that measurement.
+
+    Returns:
+        Dict[str, int]: blocks and bytes still allocated by the addon, the largest transient allocation of a frame
+        in bytes, and the growth of GC generation 0
+    """
+    def frame():
+        if prepare is not None:
+            prepare()
+        function()
+
+    for _ in range(frames):
+        frame()
+    gc.collect()
+    gc.disable()
+    try:
+        tracemalloc.start(8)
+        for _ in range(frames):
+            frame()
+        before = tracemalloc.take_snapshot()
+        gc_count = gc.get_count()[0]
+        for _ in range(frames):
+            frame()
+        gc_growth = gc.get_count()[0] - gc_count
+        after = tracemalloc.take_snapshot()
+        transient = 0
+        for index in range(frames + 1):
+            if prepare is not None:
+                prepare()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+            # The first frame also counts the first allocations of this loop
+            if index:
+                transient = max(transient, peak - current)
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    blocks = 0
+    size = 0
+    for stat in after.compare_to(before, "traceback"):
+        if any(_is_addon_frame(frame.filename) for frame in stat.traceback):
+            blocks += stat.count_diff
+            size += stat.size_diff
+    return {"retained blocks": blocks, "retained bytes": size, "transient bytes": transient,
+            "gc gen0 growth": gc_growth}
+
+
+def bench_layout(viewports: int, sync_mode: str, frames: int) -> Dict[str, Dict[str, int]]:
+    bpy, addon = layouts.load_addon()
+    layout = layouts.build_layout(bpy, viewports=viewports)
+    handler, source = layouts.enable_sync(bpy, layout, sync_mode)
+    region_3d = source.region_3d
+    callback = handler.sync_draw_callback
+    frame = [0]
+
+    def change_view():
+        # The stand-in computes the view matrix on the first read after a change, Blender doesn't
+        frame[0] ^= 1
+        region_3d.view_rotation = ROTATIONS[frame[0]]
+        region_3d.view_matrix
+
+    results = dict()
+    layouts.set_context(bpy, layout, source)
+    results["changed"] = measure(callback, frames, change_view)
+    results["unchanged"] = measure(callback, frames)
+    targets = [space for space in layout.visible_spaces() if space is not source]
+    if targets:
+        layouts.set_context(bpy, layout, targets[0])
+        results["target"] = measure(callback, frames)
+    bpy.ops.syncview.syncview_disable_sync()
+    return results
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--viewports", type=int, nargs="+", default=[8, 200], help="viewport counts to measure")
+    parser.add_argument("--modes", nargs="+", choices=SYNC_MODES, default=SYNC_MODES, help="sync modes to measure")
+    parser.add_argument("--frames", type=int, default=500, help="frames per measurement")
+
+
+def main(arguments: argparse.Namespace) -> int:
+    failures = 0
+    for sync_mode in arguments.modes:
+        for viewports in arguments.viewports:
+            print("%s/%d" % (sync_mode, viewports))
+            for path, result in bench_layout(viewports, sync_mode, arguments.frames).items():
+                leaking = result["retained blocks"] > RETAINED_BLOCKS_LIMIT or \
+                    result["gc gen0 growth"] > RETAINED_BLOCKS_LIMIT
+                allocating = result["transient bytes"] > TRANSIENT_BUDGETS[path]
+                failures += leaking or allocating
+                print("    %-10s %6d blocks %8d bytes  %6d transient bytes  gen0 %+d%s%s" % (
+                    path, result["retained blocks"], result["retained bytes"], result["transient bytes"],
+                    result["gc gen0 growth"], "  RETAINS PER FRAME" if leaking else "",
+                    "  OVER BUDGET" if allocating else ""))
+    return 1 if failures else 0
@@ -0,0 +1,74 @@
+"""
+Cost of loading the addon and of opening files, with and without tagged viewports.
+"""
+import argparse
+import sys
+import time
+import timeit
+from typing import Dict
+
+from . import layouts, standin_bpy
+
+HEAVY_MODULES = ["numpy", layouts.ADDON_NAME + ".sync_handler"]
+
+
+def _milliseconds(function) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def _load_file(bpy) -> None:
+    """Run the load handlers like Blender does when a file is opened"""
+    for handler in list(bpy.app.handlers.load_pre):
+        handler(None)
+    for handler in list(bpy.app.handlers.load_post):
+        handler(None)
+
+
+def bench_startup(viewports: int, number: int, repeat: int) -> Dict[str, object]:
+    """
+    Measure addon registration and file loads on a layout of untagged viewports, then tag and untag one of them
+
+    Returns:
+        Dict[str, object]: timings in milliseconds, and which steps left a draw handler or heavy modules loaded
+    """
+    preloaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    results = dict()
+    results["register (ms)"] = _milliseconds(layouts.load_addon)
+    bpy = standin_bpy.install()
+    results["heavy modules after register"] = [
+        name for name in HEAVY_MODULES if name in sys.modules and name not in preloaded]
+
+    layout = layouts.build_layout(bpy, viewports=viewports, tagged=False)
+    results["load untagged file (ms)"] = min(timeit.repeat(lambda: _load_file(bpy), number=number,
+                                                           repeat=repeat)) / number * 1e3
+    results["draw handlers (untagged)"] = len(standin_bpy.SpaceView3D._draw_handlers)
+
+    region_3d = layout.spaces[0].region_3d
+    region_3d.show_sync_view = True
+    results["first tag (ms)"] = _milliseconds(lambda: bpy.msgbus.publish((bpy.types.RegionView3D, "show_sync_view")))
+    results["draw handlers (tagged)"] = len(standin_bpy.SpaceView3D._draw_handlers)
+    results["load tagged file (ms)"] = min(timeit.repeat(lambda: _load_file(bpy), number=number,
+                                                         repeat=repeat)) / number * 1e3
+
+    region_3d.show_sync_view = False
+    bpy.msgbus.publish((bpy.types.RegionView3D, "show_sync_view"))
+    results["draw handlers (untagged again)"] = len(standin_bpy.SpaceView3D._draw_handlers)
+    return results
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--viewports", type=int, default=8, help="number of viewports in the loaded file")
+    parser.add_argument("--number", type=int, default=20, help="file loads per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs, the best is reported")
+
+
+def main(arguments: argparse.Namespace) -> int:
+    results = bench_startup(arguments.viewports, arguments.number, arguments.repeat)
+    for name, value in results.items():
+        if isinstance(value, float):
+            print("%-34s %10.3f" % (name, value))
+        else:
+            print("%-34s %10s" % (name, value))
+    return 0
@@ -0,0 +1,172 @@
+"""
+Per-call cost of the SyncDrawHandler hot path on synthetic layouts, in each sync mode.
+"""
+import argparse
+import json
+import timeit
+from typing import Dict, List
+
+from . import layouts
+
+SYNC_MODES = ["Window", "Workspace", "All"]
+VIEWPORT_COUNTS = [1, 8, 32, 100, 200]
+ROTATIONS = [(1.0, 0.0, 0.0, 0.0), (0.9987503, 0.0, 0.0, 0.0499792)]
+
+
+def _time_per_call(function, number: int, repeat: int) -> float:
+    """Best of `repeat` runs of `number` calls, in microseconds per call"""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def _check_synced(bpy, layout: layouts.Layout, source, sync_mode: str, operation: str, framing: bool = False) -> None:
+    """
+    Run every pending timer, then make sure every viewport synced with the source viewport shows its view
+
+    Raises:
+        AssertionError: if a synced viewport doesn't show the view of the source viewport after the operation
+    """
+    bpy.app.timers.run(float("inf"))
+    unsynced = layouts.unsynced_spaces(layout, source, sync_mode, framing)
+    if unsynced:
+        raise AssertionError("%d of %d viewports don't show the synced view after %s" % (
+            len(unsynced), len(layout.visible_spaces()) - 1, operation))
+
+
+def bench_layout(viewports: int, windows: int, workspaces: int, sync_mode: str, number: int, repeat: int) -> Dict[str, float]:
+    """
+    Measure the hot path of a freshly enabled handler on one synthetic layout
+
+    Returns:
+        Dict[str, float]: microseconds per call for each measured operation
+    """
+    bpy, addon = layouts.load_addon()
+    layout = layouts.build_layout(bpy, viewports=viewports, windows=windows, workspaces=workspaces)
+    handler, source = layouts.enable_sync(bpy, layout, sync_mode)
+
+    region_3d = source.region_3d
+    callback = handler.sync_draw_callback
+    has_viewport_changed = handler._SyncDrawHandler__has_viewport_changed
+    rebuild_space_map = handler._SyncDrawHandler__rebuild_space_map
+    window = layout.windows[0]
+    frame = [0]
+
+    def draw_changed():
+        frame[0] ^= 1
+        region_3d.view_rotation = ROTATIONS[frame[0]]
+        callback()
+
+    results = dict()
+    layouts.set_context(bpy, layout, source)
+    results["sync_draw_callback (changed)"] = _time_per_call(draw_changed, number, repeat)
+    _check_synced(bpy, layout, source, sync_mode, "sync_draw_callback (changed)")
+    results["sync_draw_callback (unchanged)"] = _time_per_call(callback, number, repeat)
+    results["__has_viewport_changed"] = _time_per_call(lambda: has_viewport_changed(source), number, repeat)
+
+    # Redraws without navigation, e.g. while sculpting, once the view has settled
+    preferences = bpy.context.preferences.addons[layouts.ADDON_NAME].preferences
+    preferences.use_event_detection = True
+    for _ in range(preferences.event_stable_draws):
+        callback()
+    results["sync_draw_callback (unchanged, events)"] = _time_per_call(callback, number, repeat)
+    preferences.use_event_detection = False
+
+    # Zooming the camera view of the active viewport, with every attribute synced or only the framing
+    region_3d.view_perspective = 'CAMERA'
+    callback()
+    zooms = [1.0, 2.0]
+
+    def zoom_changed():
+        frame[0] ^= 1
+        region_3d.view_camera_zoom = zooms[frame[0]]
+        callback()
+
+    for camera_sync_mode in ("FULL", "FRAMING"):
+        preferences.camera_sync_mode = camera_sync_mode
+        operation = "sync_draw_callback (camera %s)" % camera_sync_mode.lower()
+        results[operation] = _time_per_call(zoom_changed, number, repeat)
+        _check_synced(bpy, layout, source, sync_mode, operation, framing=camera_sync_mode == "FRAMING")
+    preferences.camera_sync_mode = "FULL"
+    region_3d.view_perspective = 'PERSP'
+    callback()
+
+    targets = [space for space in layout.visible_spaces() if space is not source]
+    if targets:
+        layouts.set_context(bpy, layout, targets[0])
+        results["sync_draw_callback (target)"] = _time_per_call(callback, number, repeat)
+
+    layouts.set_context(bpy, layout, source)
+    report_poll = addon.operator_sync_view.SYNC_VIEW_EVENTKEYMAP_OT_mouse_move.poll
+    results["report_active_area poll (same area)"] = _time_per_call(lambda: report_poll(bpy.context), number, repeat)
+    results["__rebuild_space_map"] = _time_per_call(lambda: rebuild_space_map(window), max(1, number // 10), repeat)
+    results["update_map"] = _time_per_call(handler.update_map, max(1, number // 10), repeat)
+
+    bpy.app.timers.run(float("inf"))
+    bpy.ops.syncview.syncview_disable_sync()
+    return results
+
+
+def run(viewport_counts: List[int], windows: int, workspaces: int, sync_modes: List[str], number: int,
+        repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Run bench_layout for every combination of viewport count and sync mode
+
+    Returns:
+        Dict[str, Dict[str, float]]: results keyed by "<sync mode>/<viewports>"
+    """
+    results = dict()
+    for sync_mode in sync_modes:
+        for viewports in viewport_counts:
+            key = "%s/%d" % (sync_mode, viewports)
+            results[key] = bench_layout(viewports, windows, workspaces, sync_mode, number, repeat)
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]] = None,
+                  tolerance: float = 0.25) -> int:
+    """
+    Print a table of results, compared against a baseline if one is given
+
+    Returns:
+        int: number of operations that are slower than the baseline by more than tolerance
+    """
+    regressions = 0
+    for key, operations in results.items():
+        print(key)
+        for operation, microseconds in operations.items():
+            line = "    %-38s %10.2f us" % (operation, microseconds)
+            if baseline and operation in baseline.get(key, {}):
+                ratio = microseconds / baseline[key][operation]
+                line += "  %6.2fx" % ratio
+                if ratio > 1.0 + tolerance:
+                    line += "  REGRESSION"
+                    regressions += 1
+            print(line)
+    return regressions
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--viewports", type=int, nargs="+", default=VIEWPORT_COUNTS,
+                        help="viewport counts to benchmark")
+    parser.add_argument("--windows", type=int, default=2, help="number of open windows")
+    parser.add_argument("--workspaces", type=int, default=4, help="number of workspaces")
+    parser.add_argument("--modes", nargs="+", choices=SYNC_MODES, default=SYNC_MODES, help="sync modes to benchmark")
+    parser.add_argument("--number", type=int, default=200, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs, the best is reported")
+    parser.add_argument("--json", metavar="PATH", help="write results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare against results written with --json")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative slowdown reported as a regression when comparing")
+
+
+def main(arguments: argparse.Namespace) -> int:
+    results = run(arguments.viewports, arguments.windows, arguments.workspaces, arguments.modes,
+                  arguments.number, arguments.repeat)
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)
+    regressions = print_results(results, baseline, arguments.tolerance)
+    if arguments.json:
+        with open(arguments.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return 1 if regressions else 0
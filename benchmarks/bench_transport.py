@@ -0,0 +1,130 @@
+"""
+Latency and throughput of syncing views between Blender instances, over loopback UDP.
+
+A second ViewTransport in the same process stands in for the other instance, no network or second Blender is needed.
+"""
+import argparse
+import importlib
+import time
+from typing import Dict
+
+from . import layouts
+
+
+def bench_transport(messages: int, burst: int) -> Dict[str, float]:
+    """
+    Measure the transport alone: cost of publishing and receiving, one-way latency and messages per second
+
+    Returns:
+        Dict[str, float]: measurements, times in microseconds
+    """
+    bpy, addon = layouts.load_addon()
+    transport = importlib.import_module(layouts.ADDON_NAME + ".transport")
+    view_state = importlib.import_module(layouts.ADDON_NAME + ".view_state")
+    stats = importlib.import_module(layouts.ADDON_NAME + ".stats")
+    receiver = transport.ViewTransport(port=0)
+    sender = transport.ViewTransport(port=0, peers=[receiver.address])
+    sent_view, received_view = view_state.ViewState(), view_state.ViewState()
+    results = dict()
+
+    latencies = []
+    publish_times = []
+    receive_times = []
+    for index in range(messages):
+        sent_view.buffer[0] = index
+        start = time.perf_counter()
+        sender.publish(sent_view)
+        published = time.perf_counter()
+        while True:
+            before_receive = time.perf_counter()
+            if receiver.receive(received_view):
+                break
+        received = time.perf_counter()
+        publish_times.append((published - start) * 1e6)
+        receive_times.append((received - before_receive) * 1e6)
+        latencies.append((received - start) * 1e6)
+    for samples in (publish_times, receive_times, latencies):
+        samples.sort()
+    results["publish (us)"] = stats.percentile(publish_times, 0.5)
+    results["receive (us)"] = stats.percentile(receive_times, 0.5)
+    results["latency p50 (us)"] = stats.percentile(latencies, 0.5)
+    results["latency p95 (us)"] = stats.percentile(latencies, 0.95)
+
+    start = time.perf_counter()
+    for index in range(messages):
+        sender.publish(sent_view)
+        receiver.receive(received_view)
+    results["messages/s"] = messages / (time.perf_counter() - start)
+
+    # Views sent between two polls, the receiver only applies the newest one. Bursts larger than the socket's
+    # receive buffer lose their newest views in the OS, real senders send one view per redraw.
+    received_before = receiver.packets_received
+    for index in range(burst):
+        sent_view.buffer[0] = index
+        sender.publish(sent_view)
+    receiver.receive(received_view)
+    results["burst received"] = receiver.packets_received - received_before
+    results["burst newest applied"] = float(received_view.buffer[0] == burst - 1)
+
+    sender.close()
+    receiver.close()
+    return results
+
+
+def bench_handler(viewports: int, messages: int) -> Dict[str, float]:
+    """
+    Measure views sent by another instance until they're applied to every tagged viewport by the receive timer
+
+    Returns:
+        Dict[str, float]: measurements, times in microseconds
+    """
+    bpy, addon = layouts.load_addon()
+    transport = importlib.import_module(layouts.ADDON_NAME + ".transport")
+    view_state = importlib.import_module(layouts.ADDON_NAME + ".view_state")
+    stats = importlib.import_module(layouts.ADDON_NAME + ".stats")
+    layout = layouts.build_layout(bpy, viewports=viewports)
+    handler, source = layouts.enable_sync(bpy, layout, "All")
+    remote = transport.ViewTransport(port=0)
+    preferences = bpy.context.preferences.addons[layouts.ADDON_NAME].preferences
+    preferences.transport_port = 0
+    preferences.use_transport = True
+    remote.peers = [handler.transport.address]
+    remote_view = view_state.ViewState()
+    remote_view.capture(source)
+
+    apply_times = []
+    target = layout.spaces[-1].region_3d
+    for index in range(messages):
+        rotation = (1.0, 0.0, 0.0, (index % 100) / 1000.0)
+        remote_view.buffer[view_state.VIEW_ROTATION] = rotation
+        start = time.perf_counter()
+        remote.publish(remote_view)
+        while tuple(target.view_rotation) != rotation:
+            bpy.app.timers.run(float("inf"))
+        apply_times.append((time.perf_counter() - start) * 1e6)
+
+    apply_times.sort()
+    results = {
+        "apply p50 (us)": stats.percentile(apply_times, 0.5),
+        "apply p95 (us)": stats.percentile(apply_times, 0.95),
+        "received": handler.transport.packets_received,
+    }
+    remote.close()
+    bpy.ops.syncview.syncview_disable_sync()
+    return results
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--messages", type=int, default=2000, help="messages per measurement")
+    parser.add_argument("--burst", type=int, default=32, help="views sent between two polls")
+    parser.add_argument("--viewports", type=int, default=32, help="tagged viewports in the receiving instance")
+
+
+def main(arguments: argparse.Namespace) -> int:
+    print("transport")
+    for name, value in bench_transport(arguments.messages, arguments.burst).items():
+        print("    %-34s %12.2f" % (name, value))
+    print("receiving handler, %d viewports" % arguments.viewports)
+    for name, value in bench_handler(arguments.viewports, arguments.messages).items():
+        print("    %-34s %12.2f" % (name, value))
+    return 0
@@ -0,0 +1,177 @@
+"""
+Synthetic Blender layouts built from the stand-in bpy, and helpers to load the addon and drive its draw handler.
+"""
+import importlib
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from . import standin_bpy
+
+ADDON_NAME = "sync_viewport"
+ADDON_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class Layout:
+    """A synthetic layout: every workspace has one screen per window, viewports are spread over all screens"""
+    workspaces: List[standin_bpy.WorkSpace] = field(default_factory=list)
+    windows: List[standin_bpy.Window] = field(default_factory=list)
+    spaces: List[standin_bpy.SpaceView3D] = field(default_factory=list)
+    locations: Dict[standin_bpy.SpaceView3D, tuple] = field(default_factory=dict)
+
+    def visible_spaces(self) -> List[standin_bpy.SpaceView3D]:
+        visible_screens = {window.screen for window in self.windows}
+        return [space for space in self.spaces if self.locations[space][1] in visible_screens]
+
+
+def load_addon():
+    """
+    Install the stand-in bpy and import the addon from the repository root as the package `sync_viewport`
+
+    Returns:
+        tuple: (bpy stand-in module, addon package)
+    """
+    bpy = standin_bpy.install()
+    for name in [name for name in sys.modules if name == ADDON_NAME or name.startswith(ADDON_NAME + ".")]:
+        del sys.modules[name]
+    standin_bpy.reset()
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, os.path.join(ADDON_PATH, "__init__.py"), submodule_search_locations=[ADDON_PATH])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return bpy, addon
+
+
+def build_layout(bpy, viewports: int, windows: int = 1, workspaces: int = 1, tagged: bool = True,
+                 other_areas: int = 2) -> Layout:
+    """
+    Populate the stand-in context with a synthetic layout
+
+    Args:
+        bpy: the stand-in bpy module
+        viewports (int): number of 3D viewports, spread round-robin over all screens of all workspaces
+        windows (int): number of open windows, each shows the first workspace
+        workspaces (int): number of workspaces
+        tagged (bool): whether the viewports are tagged for sync
+        other_areas (int): number of non 3D view areas in each screen
+
+    Returns:
+        Layout: the created layout
+    """
+    types = standin_bpy
+    context = bpy.context
+    layout = Layout()
+    screens = []
+    for workspace_index in range(workspaces):
+        workspace = types.WorkSpace("Workspace.%03d" % workspace_index)
+        for window_index in range(windows):
+            screen = types.Screen("Screen.%03d.%03d" % (workspace_index, window_index))
+            screen.areas = [types.Area('PROPERTIES') for _ in range(other_areas)]
+            workspace.screens.append(screen)
+            screens.append((workspace, screen))
+            context.blend_data.screens.append(screen)
+        context.blend_data.workspaces.append(workspace)
+        layout.workspaces.append(workspace)
+
+    for index in range(viewports):
+        workspace, screen = screens[index % len(screens)]
+        area = types.Area('VIEW_3D')
+        area.spaces.active.region_3d.show_sync_view = tagged
+        screen.areas.append(area)
+        layout.spaces.append(area.spaces.active)
+        layout.locations[area.spaces.active] = (workspace, screen, area)
+
+    for window_index in range(windows):
+        workspace = layout.workspaces[0]
+        window = types.Window(workspace, workspace.screens[window_index])
+        context.window_manager.windows.append(window)
+        layout.windows.append(window)
+    return layout
+
+
+def set_context(bpy, layout: Layout, space) -> None:
+    """Point the stand-in context at the given space as if Blender was drawing or handling events in it"""
+    workspace, screen, area = layout.locations[space]
+    context = bpy.context
+    context.space_data = space
+    context.region_data = space.region_3d
+    context.area = area
+    context.screen = screen
+    context.window = next((window for window in layout.windows if window.screen is screen),
+                          layout.windows[0] if layout.windows else None)
+
+
+def draw(bpy, layout: Layout, space) -> None:
+    """Run every PRE_VIEW draw handler for the given space"""
+    set_context(bpy, layout, space)
+    for callback, args in list(standin_bpy.SpaceView3D._draw_handlers.values()):
+        callback(*args)
+
+
+def report_active(bpy, layout: Layout, space) -> None:
+    """Report the given space as the active one, like the mouse move keymap does"""
+    set_context(bpy, layout, space)
+    try:
+        bpy.ops.syncview.report_active_area()
+    except RuntimeError:
+        # A keymap item whose operator fails its poll passes the event through
+        pass
+
+
+def enable_sync(bpy, layout: Layout, sync_mode: str):
+    """
+    Enable sync with the first visible viewport as the active one, and let every viewport register itself
+    the way the first redraw after enabling does
+
+    Returns:
+        tuple: (SyncDrawHandler, active space)
+    """
+    bpy.ops.syncview.syncview_enable_sync()
+    handler = bpy.app.driver_namespace['sync_view']
+    preferences = bpy.context.preferences.addons[ADDON_NAME].preferences
+    source = layout.visible_spaces()[0]
+    report_active(bpy, layout, source)
+    preferences.sync_mode = sync_mode
+    for space in layout.spaces:
+        draw(bpy, layout, space)
+    draw(bpy, layout, source)
+    return handler, source
+
+
+def unsynced_spaces(layout: Layout, source, sync_mode: str, framing: bool = False) -> List[standin_bpy.SpaceView3D]:
+    """
+    Find the visible viewports the sync mode syncs with the source viewport whose view differs from it
+
+    Args:
+        layout (Layout): layout sync is enabled on
+        source: active viewport
+        sync_mode (str): sync mode sync is enabled with
+        framing (bool): compare only the camera framing of viewports in camera view and the view matrix of others,
+            which is all the FRAMING camera sync mode writes
+
+    Returns:
+        List[standin_bpy.SpaceView3D]: viewports that don't show the view of the source viewport
+    """
+    view_state = importlib.import_module(ADDON_NAME + ".view_state")
+    source_screen = layout.locations[source][1]
+    source_view, view = view_state.ViewState(), view_state.ViewState()
+    source_view.capture(source)
+    unsynced = []
+    for space in layout.visible_spaces():
+        if space is source or (sync_mode == "Window" and layout.locations[space][1] is not source_screen):
+            continue
+        view.capture(space)
+        if not framing:
+            synced = view.matches(source_view)
+        elif space.region_3d.view_perspective == 'CAMERA':
+            synced = view.matches_framing(source_view)
+        else:
+            synced = space.region_3d.view_matrix == source.region_3d.view_matrix
+        if not synced:
+            unsynced.append(space)
+    return unsynced
@@ -0,0 +1,253 @@
+"""
+Replay of session traces against SyncDrawHandler, for regression testing the sync path on recorded sessions.
+
+Traces are recorded in Blender with the Record Trace button of the Sync View profiling panel, or synthesized on a
+stand-in layout with --synthesize. Replaying rebuilds the recorded layout and preferences in the stand-in bpy,
+applies the recorded views of the active viewport and reruns every draw callback, active area report and msgbus
+notification in order. Timers run after every event, as fast as possible unless --realtime paces the events.
+"""
+import argparse
+import importlib
+import json
+import os
+import time
+from typing import Dict
+
+from . import layouts, standin_bpy
+from .bench_sync_handler import print_results
+
+# Preferences that are not restored from the trace: lazy startup would enable sync on its own, and profiling
+# would add its own cost to every replayed event
+SKIPPED_PREFERENCES = ("use_lazy_startup", "enable_profiling")
+REPLAYED_EVENTS = ("draw", "active", "msgbus", "view_dirty")
+
+
+def build_recorded_layout(bpy, description: dict, viewport_settings_key: str) -> layouts.Layout:
+    """
+    Populate the stand-in context with the windows, workspaces and screens described at the start of a trace
+
+    Args:
+        bpy: the stand-in bpy module
+        description (dict): layout description of the trace
+        viewport_settings_key (str): ID property screens store viewport settings in
+
+    Returns:
+        layouts.Layout: the created layout, holding every 3D viewport
+    """
+    context = bpy.context
+    layout = layouts.Layout()
+    screens = dict()
+    for name, screen_description in description["screens"].items():
+        screen = screens[name] = standin_bpy.Screen(name)
+        screen.areas = [standin_bpy.Area(area_type) for area_type in screen_description["areas"]]
+        for area_index in screen_description["tagged"]:
+            screen.areas[area_index].spaces.active.region_3d.show_sync_view = True
+        if screen_description["do_not_sync"]:
+            screen["sync_view.do_not_sync"] = True
+        if screen_description["viewport_settings"]:
+            screen[viewport_settings_key] = screen_description["viewport_settings"]
+        context.blend_data.screens.append(screen)
+
+    workspaces = dict()
+    for workspace_description in description["workspaces"]:
+        workspace = workspaces[workspace_description["name"]] = standin_bpy.WorkSpace(workspace_description["name"])
+        workspace.screens = [screens[name] for name in workspace_description["screens"]]
+        context.blend_data.workspaces.append(workspace)
+        layout.workspaces.append(workspace)
+        for screen in workspace.screens:
+            for area in screen.areas:
+                if area.type == 'VIEW_3D':
+                    layout.spaces.append(area.spaces.active)
+                    layout.locations[area.spaces.active] = (workspace, screen, area)
+
+    for window_description in description["windows"]:
+        window = standin_bpy.Window(workspaces[window_description["workspace"]], screens[window_description["screen"]])
+        context.window_manager.windows.append(window)
+        layout.windows.append(window)
+    return layout
+
+
+def apply_view(view_state_module, space, values) -> None:
+    """Set every synced attribute of a space to a recorded view buffer, the way navigating to it would"""
+    view = view_state_module.ViewState()
+    view.buffer[:] = values
+    packet = view_state_module.ViewPacket.from_view_state(view)
+    for attribute, value in zip(view_state_module.SPACE_ATTRIBUTES, packet.space_values):
+        setattr(space, attribute, value)
+    for attribute, value in zip(view_state_module.VIEW_REGION_3D_ATTRIBUTES, packet.region_3d_values):
+        setattr(space.region_3d, attribute, value)
+
+
+def replay(filepath: str, realtime: bool = False) -> Dict[str, float]:
+    """
+    Replay a trace and measure the time spent handling each type of event, including the timers it ran
+
+    Args:
+        filepath (str): trace to replay
+        realtime (bool): wait between events as long as they were apart when recorded, so timers fire as they did
+
+    Returns:
+        Dict[str, float]: event counts, throughput and latencies in microseconds
+    """
+    bpy, addon = layouts.load_addon()
+    trace = importlib.import_module(layouts.ADDON_NAME + ".trace")
+    view_state = importlib.import_module(layouts.ADDON_NAME + ".view_state")
+    stats = importlib.import_module(layouts.ADDON_NAME + ".stats")
+    viewports = importlib.import_module(layouts.ADDON_NAME + ".utils.viewports")
+    description, events = trace.read_trace(filepath)
+    layout = build_recorded_layout(bpy, description, viewports.VIEWPORT_SETTINGS_KEY)
+    preferences = bpy.context.preferences.addons[layouts.ADDON_NAME].preferences
+    for name, value in description["preferences"].items():
+        if name not in SKIPPED_PREFERENCES:
+            setattr(preferences, name, value)
+    bpy.ops.syncview.syncview_enable_sync()
+
+    spaces = []
+    latencies = {event: [] for event in REPLAYED_EVENTS}
+    started = time.perf_counter()
+    for event_type, seconds, payload in events:
+        if realtime:
+            delay = started + seconds - time.perf_counter()
+            if delay > 0.0:
+                time.sleep(delay)
+        if event_type == trace.EVENT_SPACE:
+            location = payload[0]
+            screen = next((screen for screen in bpy.context.blend_data.screens
+                           if screen.name == location["screen"]), None)
+            space = (screen.areas[location["area"]].spaces.active
+                     if screen is not None and location["area"] >= 0 else None)
+            spaces.append(space)
+            continue
+        if event_type == trace.EVENT_VIEW_DIRTY:
+            sync_view = bpy.app.driver_namespace.get('sync_view')
+            start = time.perf_counter()
+            if sync_view is not None:
+                sync_view.mark_view_dirty()
+            latencies["view_dirty"].append(time.perf_counter() - start)
+            continue
+        space = spaces[payload[0]] if event_type != trace.EVENT_MSGBUS else None
+        if event_type == trace.EVENT_VIEW:
+            if space is not None:
+                apply_view(view_state, space, payload[1:])
+            continue
+        if event_type != trace.EVENT_MSGBUS and (space is None or space not in layout.locations):
+            continue
+
+        start = time.perf_counter()
+        if event_type == trace.EVENT_DRAW:
+            layouts.draw(bpy, layout, space)
+            latencies["draw"].append(time.perf_counter() - start)
+        elif event_type == trace.EVENT_ACTIVE:
+            layouts.set_context(bpy, layout, space)
+            bpy.context.window = layout.windows[min(payload[1], len(layout.windows) - 1)]
+            try:
+                bpy.ops.syncview.report_active_area()
+            except RuntimeError:
+                pass
+            latencies["active"].append(time.perf_counter() - start)
+        else:
+            for index, tagged in payload[0]["tags"].items():
+                if spaces[int(index)] is not None:
+                    spaces[int(index)].region_3d.show_sync_view = tagged
+            for window, window_description in zip(layout.windows, payload[0]["windows"]):
+                window.workspace = next(workspace for workspace in layout.workspaces
+                                        if workspace.name == window_description["workspace"])
+                window.screen = next(screen for screen in window.workspace.screens
+                                     if screen.name == window_description["screen"])
+            bpy.msgbus.publish((bpy.types.RegionView3D, "show_sync_view"))
+            latencies["msgbus"].append(time.perf_counter() - start)
+        bpy.app.timers.run()
+    bpy.app.timers.run(float("inf"))
+    elapsed = time.perf_counter() - started
+    bpy.ops.syncview.syncview_disable_sync()
+
+    handled = sum(len(samples) for samples in latencies.values())
+    results = {
+        "events": handled,
+        "events/s": handled / sum(sum(samples) for samples in latencies.values()) if handled else 0.0,
+        "replay (s)": elapsed,
+    }
+    for event, samples in latencies.items():
+        if samples:
+            samples.sort()
+            results["%s p50 (us)" % event] = stats.percentile(samples, 0.5) * 1e6
+            results["%s p95 (us)" % event] = stats.percentile(samples, 0.95) * 1e6
+    return results
+
+
+def synthesize(filepath: str, viewports: int, windows: int, workspaces: int, sync_mode: str, frames: int) -> int:
+    """
+    Record a trace of a synthetic session: the active viewport orbits while every visible viewport redraws,
+    the active viewport moves to the next visible one every 60 frames, and one viewport is untagged and tagged
+    again halfway through
+
+    Returns:
+        int: number of recorded events
+    """
+    bpy, addon = layouts.load_addon()
+    layout = layouts.build_layout(bpy, viewports=viewports, windows=windows, workspaces=workspaces)
+    handler, source = layouts.enable_sync(bpy, layout, sync_mode)
+    visible = layout.visible_spaces()
+    handler.start_trace(filepath)
+    for frame in range(frames):
+        if frame and frame % 60 == 0:
+            source = visible[(visible.index(source) + 1) % len(visible)]
+            layouts.report_active(bpy, layout, source)
+        if frame == frames // 2 and len(visible) > 1:
+            toggled = visible[-1] if visible[-1] is not source else visible[0]
+            for tagged in (False, True):
+                toggled.region_3d.show_sync_view = tagged
+                bpy.msgbus.publish((bpy.types.RegionView3D, "show_sync_view"))
+        # Orbiting starts with an event the navigation keymap item reports, unless the view is still dirty
+        layouts.set_context(bpy, layout, source)
+        try:
+            bpy.ops.syncview.report_navigation()
+        except RuntimeError:
+            pass
+        standin_bpy.orbit(source.region_3d, 0.01)
+        for space in visible:
+            layouts.draw(bpy, layout, space)
+        bpy.app.timers.run()
+    event_count = handler.recorder.event_count
+    handler.stop_trace()
+    bpy.ops.syncview.syncview_disable_sync()
+    return event_count
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("trace", help="trace file to replay, or to write with --synthesize")
+    parser.add_argument("--synthesize", action="store_true",
+                        help="record a trace of a synthetic session instead of replaying one")
+    parser.add_argument("--viewports", type=int, default=8, help="viewports of the synthetic session")
+    parser.add_argument("--windows", type=int, default=2, help="open windows of the synthetic session")
+    parser.add_argument("--workspaces", type=int, default=2, help="workspaces of the synthetic session")
+    parser.add_argument("--mode", choices=["Window", "Workspace", "All"], default="All",
+                        help="sync mode of the synthetic session")
+    parser.add_argument("--frames", type=int, default=600, help="frames of the synthetic session")
+    parser.add_argument("--realtime", action="store_true", help="replay events at their recorded times")
+    parser.add_argument("--json", metavar="PATH", help="write results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare against results written with --json")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative slowdown reported as a regression when comparing")
+
+
+def main(arguments: argparse.Namespace) -> int:
+    if arguments.synthesize:
+        event_count = synthesize(arguments.trace, arguments.viewports, arguments.windows, arguments.workspaces,
+                                 arguments.mode, arguments.frames)
+        print("Recorded %d events to %s" % (event_count, arguments.trace))
+        return 0
+
+    results = replay(arguments.trace, arguments.realtime)
+    print("%d events replayed in %.3f s, %.0f events/s handled" % (
+        results.pop("events"), results.pop("replay (s)"), results.pop("events/s")))
+    key = os.path.basename(arguments.trace)
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)
+    regressions = print_results({key: results}, baseline, arguments.tolerance)
+    if arguments.json:
+        with open(arguments.json, "w") as file:
+            json.dump({key: results}, file, indent=2)
+    return 1 if regressions else 0
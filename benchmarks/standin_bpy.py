@@ -0,0 +1,482 @@
+"""
+A stand-in for the parts of the bpy module that Sync View touches, so the addon can be imported and driven
+on plain Python without Blender. Only the attributes read and written by the addon are modelled; view matrices
+are derived from rotation, location and distance the same way Blender's RegionView3D does.
+"""
+import math
+import sys
+import time
+import types as pytypes
+
+
+def _quaternion_to_matrix(quaternion):
+    w, x, y, z = quaternion
+    return [
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ]
+
+
+def _view_matrix(location, rotation, distance):
+    # view_matrix = inverse(translate(location) * rotate(rotation) * translate(0, 0, distance))
+    rotation = _quaternion_to_matrix(rotation)
+    inverse_rotation = [[rotation[j][i] for j in range(3)] for i in range(3)]
+    translation = [-sum(inverse_rotation[i][j] * location[j] for j in range(3)) for i in range(3)]
+    translation[2] -= distance
+    return [inverse_rotation[i] + [translation[i]] for i in range(3)] + [[0.0, 0.0, 0.0, 1.0]]
+
+
+class _IDPropertyMixin:
+    """Custom (ID) property storage used by screens"""
+
+    def _id_properties(self):
+        try:
+            return self.__dict__["_properties"]
+        except KeyError:
+            properties = self.__dict__["_properties"] = {}
+            return properties
+
+    def __contains__(self, key):
+        return key in self._id_properties()
+
+    def __getitem__(self, key):
+        return self._id_properties()[key]
+
+    def __setitem__(self, key, value):
+        self._id_properties()[key] = value
+
+    def __delitem__(self, key):
+        del self._id_properties()[key]
+
+    def get(self, key, default=None):
+        return self._id_properties().get(key, default)
+
+
+class bpy_struct:
+    pass
+
+
+class RegionView3D(bpy_struct):
+    def __init__(self):
+        self.show_sync_view = False
+        self.is_orthographic_side_view = False
+        self.is_perspective = True
+        self.lock_rotation = False
+        self.use_box_clip = False
+        self.use_clip_planes = False
+        self.view_camera_offset = (0.0, 0.0)
+        self.view_camera_zoom = 0.0
+        self.view_perspective = 'PERSP'
+        self.clip_planes = [[0.0, 0.0, 0.0, 0.0] for _ in range(4)]
+        self._view_distance = 10.0
+        self._view_location = (0.0, 0.0, 0.0)
+        self._view_rotation = (1.0, 0.0, 0.0, 0.0)
+        self._view_matrix = None
+
+    def _set_view(self, name, value):
+        setattr(self, name, value)
+        self._view_matrix = None
+
+    view_distance = property(lambda self: self._view_distance,
+                             lambda self, value: self._set_view("_view_distance", float(value)))
+    view_location = property(lambda self: self._view_location,
+                             lambda self, value: self._set_view("_view_location", tuple(value)))
+    view_rotation = property(lambda self: self._view_rotation,
+                             lambda self, value: self._set_view("_view_rotation", tuple(value)))
+
+    @property
+    def view_matrix(self):
+        # Computed outside the getter, whose comprehensions would otherwise allocate closure cells on every read
+        if self._view_matrix is None:
+            self._view_matrix = _view_matrix(self._view_location, self._view_rotation, self._view_distance)
+        return self._view_matrix
+
+    @view_matrix.setter
+    def view_matrix(self, matrix):
+        self._view_matrix = [list(row) for row in matrix]
+
+
+class _ShadingSettings:
+    def __init__(self):
+        self.type = 'SOLID'
+
+
+class _OverlaySettings:
+    def __init__(self):
+        self.show_overlays = True
+
+
+class Space(bpy_struct):
+    pass
+
+
+class SpaceView3D(Space):
+    _draw_handlers = {}
+
+    def __init__(self):
+        self.type = 'VIEW_3D'
+        self.region_3d = RegionView3D()
+        self.region_quadviews = []
+        self.lens = 50.0
+        self.clip_start = 0.01
+        self.clip_end = 1000.0
+        self.lock_object = None
+        self.lock_cursor = False
+        self.shading = _ShadingSettings()
+        self.overlay = _OverlaySettings()
+
+    @classmethod
+    def draw_handler_add(cls, callback, args, region_type, draw_type):
+        handle = object()
+        cls._draw_handlers[handle] = (callback, args)
+        return handle
+
+    @classmethod
+    def draw_handler_remove(cls, handle, region_type):
+        del cls._draw_handlers[handle]
+
+
+class _AreaSpaces(list):
+    @property
+    def active(self):
+        return self[0] if self else None
+
+
+class Area(bpy_struct):
+    def __init__(self, area_type='VIEW_3D'):
+        self.type = area_type
+        self.spaces = _AreaSpaces([SpaceView3D()] if area_type == 'VIEW_3D' else [])
+
+
+class Screen(_IDPropertyMixin, bpy_struct):
+    def __init__(self, name="Screen"):
+        self.name = name
+        self.areas = []
+        self.is_animation_playing = False
+
+
+class WorkSpace(_IDPropertyMixin, bpy_struct):
+    def __init__(self, name="Workspace"):
+        self.name = name
+        self.screens = []
+
+
+class Window(bpy_struct):
+    def __init__(self, workspace, screen):
+        self.workspace = workspace
+        self.screen = screen
+
+
+class _KeyMapItems(list):
+    def new(self, idname, type, value, **kwargs):
+        item = pytypes.SimpleNamespace(idname=idname, type=type, value=value, **kwargs)
+        self.append(item)
+        return item
+
+    def find_from_operator(self, idname):
+        return next((item for item in self if item.idname == idname), None)
+
+
+class _KeyMaps(list):
+    def new(self, name, space_type='EMPTY', **kwargs):
+        keymap = pytypes.SimpleNamespace(name=name, space_type=space_type, keymap_items=_KeyMapItems())
+        self.append(keymap)
+        return keymap
+
+    def find(self, name, space_type='EMPTY'):
+        return next((keymap for keymap in self if keymap.name == name), None)
+
+
+class WindowManager(bpy_struct):
+    def __init__(self):
+        self.windows = []
+        self.keyconfigs = pytypes.SimpleNamespace(addon=pytypes.SimpleNamespace(keymaps=_KeyMaps()))
+
+
+class BlendData:
+    def __init__(self):
+        self.screens = []
+        self.workspaces = []
+
+
+class Scene(bpy_struct):
+    def __init__(self):
+        self.camera = None
+        self.frame_current = 1
+
+
+class Context:
+    def __init__(self):
+        self.window_manager = WindowManager()
+        self.blend_data = BlendData()
+        self.preferences = pytypes.SimpleNamespace(addons={})
+        self.scene = Scene()
+        self.window = None
+        self.screen = None
+        self.area = None
+        self.space_data = None
+        self.region_data = None
+
+
+class _PropertyDeferred:
+    def __init__(self, function, keywords):
+        self.function = function
+        self.keywords = keywords
+
+
+def _property_factory(name):
+    def factory(**keywords):
+        return _PropertyDeferred(name, keywords)
+    factory.__name__ = name
+    return factory
+
+
+class _RegisterableType:
+    pass
+
+
+class Operator(_RegisterableType):
+    def report(self, type, message):
+        pass
+
+
+class Panel(_RegisterableType):
+    pass
+
+
+class Header(_RegisterableType):
+    pass
+
+
+class PropertyGroup(_RegisterableType):
+    pass
+
+
+class AddonPreferences(_RegisterableType):
+    pass
+
+
+class _HeaderType:
+    def __init__(self):
+        self.draw_functions = []
+
+    def append(self, function):
+        self.draw_functions.append(function)
+
+    def remove(self, function):
+        self.draw_functions.remove(function)
+
+
+class _Timers:
+    """bpy.app.timers, driven manually through run() with an explicit clock"""
+
+    def __init__(self):
+        self._timers = {}
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self._timers[function] = time.perf_counter() + first_interval
+
+    def unregister(self, function):
+        del self._timers[function]
+
+    def is_registered(self, function):
+        return function in self._timers
+
+    def run(self, now=None):
+        """Call every timer that is due, like Blender's event loop would"""
+        now = time.perf_counter() if now is None else now
+        for function, due in list(self._timers.items()):
+            if due <= now and function in self._timers:
+                interval = function()
+                if interval is None:
+                    self._timers.pop(function, None)
+                elif function in self._timers:
+                    self._timers[function] = now + interval
+
+
+class _MsgBus:
+    def __init__(self):
+        self.subscriptions = []
+
+    def subscribe_rna(self, key, owner, args, notify, options=set()):
+        self.subscriptions.append((key, owner, args, notify))
+
+    def clear_by_owner(self, owner):
+        self.subscriptions = [subscription for subscription in self.subscriptions if subscription[1] is not owner]
+
+    def publish(self, key):
+        """Call every subscriber of the given (type, property) key"""
+        for subscription_key, owner, args, notify in list(self.subscriptions):
+            if subscription_key == key:
+                notify(*args)
+
+
+class _OperatorCategory:
+    def __init__(self, name):
+        self._name = name
+
+
+class _Ops:
+    def __init__(self):
+        self._operators = {}
+
+    def __getattr__(self, category):
+        if category.startswith("_"):
+            raise AttributeError(category)
+        namespace = pytypes.SimpleNamespace()
+        for idname, operator_class in self._operators.items():
+            operator_category, operator_name = idname.split(".")
+            if operator_category == category:
+                setattr(namespace, operator_name, self._caller(operator_class))
+        return namespace
+
+    @staticmethod
+    def _caller(operator_class):
+        def call(*args, **kwargs):
+            operator = operator_class()
+            _install_property_defaults(operator, operator_class)
+            for key, value in kwargs.items():
+                setattr(operator, key, value)
+            if hasattr(operator_class, "poll") and not operator_class.poll(context):
+                raise RuntimeError("Operator poll() failed")
+            return operator.execute(context)
+        return call
+
+
+def _property_default(deferred):
+    keywords = deferred.keywords
+    if "default" in keywords:
+        default = keywords["default"]
+        if deferred.function == "EnumProperty" and isinstance(default, int):
+            items = keywords["items"]
+            return items[default][0] if isinstance(items, (list, tuple)) else default
+        return default
+    return {"BoolProperty": False, "IntProperty": 0, "FloatProperty": 0.0, "StringProperty": "",
+            "EnumProperty": None}.get(deferred.function)
+
+
+def _class_properties(cls):
+    properties = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).get("__annotations__", {}).items():
+            if isinstance(value, _PropertyDeferred):
+                properties[name] = value
+    return properties
+
+
+def _install_property_defaults(instance, cls):
+    for name, deferred in _class_properties(cls).items():
+        object.__setattr__(instance, name, _property_default(deferred))
+
+
+def _make_instance_with_updates(cls):
+    """Create an instance of a property-holding class whose properties call their update callbacks"""
+    properties = _class_properties(cls)
+
+    class Instance(cls):
+        def __setattr__(self, name, value):
+            object.__setattr__(self, name, value)
+            deferred = properties.get(name)
+            if deferred is not None and deferred.keywords.get("update"):
+                deferred.keywords["update"](self, context)
+
+    instance = Instance.__new__(Instance)
+    _install_property_defaults(instance, cls)
+    return instance
+
+
+def _register_class(cls):
+    if issubclass(cls, AddonPreferences):
+        context.preferences.addons[cls.bl_idname] = pytypes.SimpleNamespace(
+            preferences=_make_instance_with_updates(cls))
+    elif issubclass(cls, Operator):
+        ops._operators[cls.bl_idname] = cls
+    _registered_classes.append(cls)
+
+
+def _unregister_class(cls):
+    if issubclass(cls, AddonPreferences):
+        context.preferences.addons.pop(cls.bl_idname, None)
+    elif issubclass(cls, Operator):
+        ops._operators.pop(cls.bl_idname, None)
+    _registered_classes.remove(cls)
+
+
+def _persistent(function):
+    function._bpy_persistent = True
+    return function
+
+
+def _make_module(name, **attributes):
+    module = pytypes.ModuleType(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+_registered_classes = []
+context = Context()
+ops = _Ops()
+
+types = _make_module(
+    "bpy.types",
+    bpy_struct=bpy_struct, Space=Space, SpaceView3D=SpaceView3D, RegionView3D=RegionView3D, Area=Area,
+    Screen=Screen, WorkSpace=WorkSpace, Window=Window, WindowManager=WindowManager, Context=Context,
+    Scene=Scene, Operator=Operator, Panel=Panel, Header=Header, PropertyGroup=PropertyGroup,
+    AddonPreferences=AddonPreferences, Event=object, Object=object, VIEW3D_HT_header=_HeaderType(),
+)
+props = _make_module("bpy.props", **{
+    name: _property_factory(name)
+    for name in ("BoolProperty", "IntProperty", "FloatProperty", "StringProperty", "EnumProperty",
+                 "FloatVectorProperty", "PointerProperty", "CollectionProperty")
+})
+handlers = _make_module(
+    "bpy.app.handlers", persistent=_persistent,
+    load_pre=[], load_post=[], frame_change_pre=[], frame_change_post=[], depsgraph_update_post=[],
+)
+timers = _Timers()
+app = _make_module("bpy.app", handlers=handlers, timers=timers, driver_namespace={}, version=(3, 5, 0))
+msgbus = _MsgBus()
+utils = _make_module("bpy.utils", register_class=_register_class, unregister_class=_unregister_class)
+path = _make_module("bpy.path", abspath=lambda filepath: filepath)
+bpy = _make_module("bpy", types=types, props=props, app=app, msgbus=msgbus, utils=utils, ops=ops, context=context,
+                   path=path)
+
+
+def install() -> pytypes.ModuleType:
+    """Install the stand-in as the bpy module and return it"""
+    sys.modules["bpy"] = bpy
+    sys.modules["bpy.types"] = types
+    sys.modules["bpy.props"] = props
+    sys.modules["bpy.app"] = app
+    sys.modules["bpy.app.handlers"] = handlers
+    sys.modules["bpy.utils"] = utils
+    sys.modules["bpy.path"] = path
+    return bpy
+
+
+def reset() -> None:
+    """Reset the global state of the stand-in between runs"""
+    global context
+    context = Context()
+    bpy.context = context
+    app.driver_namespace.clear()
+    # Blender's driver namespace is never empty, it holds the math functions available to drivers
+    app.driver_namespace.update({name: getattr(math, name) for name in ("sin", "cos", "pi")})
+    msgbus.subscriptions.clear()
+    timers._timers.clear()
+    SpaceView3D._draw_handlers.clear()
+    for handler_list in (handlers.load_pre, handlers.load_post, handlers.frame_change_pre,
+                         handlers.frame_change_post, handlers.depsgraph_update_post):
+        handler_list.clear()
+    ops._operators.clear()
+    types.VIEW3D_HT_header.draw_functions.clear()
+    _registered_classes.clear()
+
+
+def orbit(region_3d: RegionView3D, angle: float) -> None:
+    """Rotate a view around its Z axis by the given angle in radians, like a turntable orbit"""
+    half = angle / 2.0
+    dw, dz = math.cos(half), math.sin(half)
+    w, x, y, z = region_3d.view_rotation
+    region_3d.view_rotation = (dw * w - dz * z, dw * x - dz * y, dw * y + dz * x, dw * z + dz * w)
@@ -0,0 +1,77 @@
+import bpy
+from typing import NamedTuple
+
+
+class SyncConfig(NamedTuple):
+    """
+    Immutable snapshot of the addon preferences read by the sync hot path.
+
+    SyncDrawHandler holds one and replaces it from the preferences' update callbacks, so draw callbacks
+    read plain attributes instead of resolving the addon preferences and the sync mode name on every draw.
+    """
+    sync_mode: int = 0
+    pause_sync: bool = False
+    sync_playback: bool = True
+    sync_camera_view: bool = True
+    camera_sync_mode: str = "FULL"
+    use_sync_scheduler: bool = False
+    sync_rate: int = 60
+    use_playback_decimation: bool = False
+    playback_decimation_mode: str = "FRAMES"
+    playback_frame_step: int = 4
+    playback_rate: int = 10
+    use_navigation_lod: bool = False
+    navigation_lod_shading: str = "SOLID"
+    navigation_lod_hide_overlays: bool = True
+    navigation_lod_idle_time: float = 0.3
+    use_change_threshold: bool = False
+    change_threshold_angle: float = 0.0017453292519943296
+    change_threshold_distance: float = 0.001
+    use_transport: bool = False
+    transport_port: int = 27450
+    transport_peers: str = ""
+    use_frame_budget: bool = False
+    frame_budget: float = 0.002
+    use_event_detection: bool = False
+    event_stable_draws: int = 8
+    event_poll_interval: int = 30
+
+    @classmethod
+    def from_preferences(cls, preferences: bpy.types.AddonPreferences) -> "SyncConfig":
+        """
+        Create a snapshot of the given addon preferences
+
+        Args:
+            preferences (bpy.types.AddonPreferences): SyncViewPreferences instance
+
+        Returns:
+            SyncConfig: snapshot of the preferences
+        """
+        return cls(
+            sync_mode=preferences.sync_modes[preferences.sync_mode],
+            pause_sync=preferences.pause_sync,
+            sync_playback=preferences.sync_playback,
+            sync_camera_view=preferences.sync_camera_view,
+            camera_sync_mode=preferences.camera_sync_mode,
+            use_sync_scheduler=preferences.use_sync_scheduler,
+            sync_rate=preferences.sync_rate,
+            use_playback_decimation=preferences.use_playback_decimation,
+            playback_decimation_mode=preferences.playback_decimation_mode,
+            playback_frame_step=preferences.playback_frame_step,
+            playback_rate=preferences.playback_rate,
+            use_navigation_lod=preferences.use_navigation_lod,
+            navigation_lod_shading=preferences.navigation_lod_shading,
+            navigation_lod_hide_overlays=preferences.navigation_lod_hide_overlays,
+            navigation_lod_idle_time=preferences.navigation_lod_idle_time,
+            use_change_threshold=preferences.use_change_threshold,
+            change_threshold_angle=preferences.change_threshold_angle,
+            change_threshold_distance=preferences.change_threshold_distance,
+            use_transport=preferences.use_transport,
+            transport_port=preferences.transport_port,
+            transport_peers=preferences.transport_peers,
+            use_frame_budget=preferences.use_frame_budget,
+            frame_budget=preferences.frame_budget_ms / 1000.0,
+            use_event_detection=preferences.use_event_detection,
+            event_stable_draws=preferences.event_stable_draws,
+            event_poll_interval=preferences.event_poll_interval,
+        )
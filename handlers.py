@@ -1,14 +1,25 @@
 import bpy
 from bpy.app.handlers import persistent
 from . import msgbus
+from .utils.viewports import any_viewport_tagged
 
 
 @persistent
 def post_load_handler(dummy):
-    bpy.ops.syncview.syncview_enable_sync()
+    # With lazy startup, sync is enabled by msgbus once a viewport gets tagged
+    preferences = bpy.context.preferences.addons[__package__].preferences
+    if not preferences.use_lazy_startup or any_viewport_tagged():
+        bpy.ops.syncview.syncview_enable_sync()
     msgbus.register()
 
 
+@persistent
+def frame_change_post_handler(scene, depsgraph=None):
+    sync_view = bpy.app.driver_namespace.get('sync_view')
+    if sync_view is not None:
+        sync_view.frame_change()
+
+
 @persistent
 def pre_load_handler(dummy):
     msgbus.unregister()
@@ -18,8 +29,10 @@ def pre_load_handler(dummy):
 def register():
     bpy.app.handlers.load_pre.append(pre_load_handler)
     bpy.app.handlers.load_post.append(post_load_handler)
+    bpy.app.handlers.frame_change_post.append(frame_change_post_handler)
 
 
 def unregister():
+    bpy.app.handlers.frame_change_post.remove(frame_change_post_handler)
     bpy.app.handlers.load_post.remove(post_load_handler)
     bpy.app.handlers.load_pre.remove(pre_load_handler)
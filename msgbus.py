@@ -1,5 +1,11 @@
 import bpy
 import logging
+from .utils.viewports import any_viewport_tagged
+
+# View properties whose RNA changes are reported to the draw handler
+VIEW_REGION_3D_PROPERTIES = ("view_location", "view_rotation", "view_distance", "view_perspective",
+                             "view_camera_zoom", "view_camera_offset")
+VIEW_SPACE_PROPERTIES = ("lens", "clip_start", "clip_end")
 
 
 def register():
@@ -10,14 +16,24 @@ def register():
         """
         When any viewport's show_sync_view RNA property changes, do one of:
         - Initialize and enable sync if it's not already enabled
-        - Call build_map on the SyncHandler class
+        - Call update_map on the SyncHandler class, which only rescans the screens shown in windows
+        - With lazy startup, disable sync if the updated map is empty and no viewport is tagged anymore.
+          Every screen is only scanned when the map is empty, since the map may not cover every screen.
         """
+        preferences = bpy.context.preferences.addons[__package__].preferences
         if 'sync_view' not in bpy.app.driver_namespace:
+            if preferences.use_lazy_startup and not any_viewport_tagged():
+                return
             logger = logging.getLogger(__name__ + ".MsgBusSyncViewCallback")
             logger.info("Enabling sync draw handler")
             bpy.ops.syncview.syncview_enable_sync()
         else:
-            bpy.app.driver_namespace['sync_view'].build_map()
+            sync_view = bpy.app.driver_namespace['sync_view']
+            sync_view.update_map()
+            if preferences.use_lazy_startup and not sync_view.has_mapped_spaces() and not any_viewport_tagged():
+                logger = logging.getLogger(__name__ + ".MsgBusSyncViewCallback")
+                logger.info("No viewport is tagged, disabling sync draw handler")
+                bpy.ops.syncview.syncview_disable_sync()
 
     # Callback for when a viewport's show_sync_view RNA property changes
     key = (bpy.types.RegionView3D, "show_sync_view")
@@ -28,6 +44,27 @@ def register():
         notify=sync_view_callback,
     )
 
+    def view_changed_callback(*args):
+        """
+        When a view property of any viewport changes through RNA, e.g. from the View sidebar or a script,
+        have the draw handler compare the view of the active viewport again.
+        The handler's own writes to synced viewports notify as well, which only extends the comparing by a few draws
+        """
+        sync_view = bpy.app.driver_namespace.get('sync_view')
+        if sync_view is not None and sync_view.is_waiting_for_view_change():
+            sync_view.mark_view_dirty()
+
+    # Callbacks for view properties changed without navigating, navigation is reported through the keymap
+    view_keys = [(bpy.types.RegionView3D, name) for name in VIEW_REGION_3D_PROPERTIES]
+    view_keys += [(bpy.types.SpaceView3D, name) for name in VIEW_SPACE_PROPERTIES]
+    for key in view_keys:
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=owner,
+            args=(),
+            notify=view_changed_callback,
+        )
+
     # Callback for when we switch viewport types
     key = (bpy.types.Window, "workspace")
     bpy.msgbus.subscribe_rna(
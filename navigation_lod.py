@@ -0,0 +1,127 @@
+import bpy
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+# Viewport shading types from cheapest to most expensive to draw
+SHADING_COST = {"WIREFRAME": 0, "SOLID": 1, "MATERIAL": 2, "RENDERED": 3}
+
+
+class NavigationLOD:
+    """
+    Cheaper drawing of synced viewports while the active viewport is navigated.
+
+    downgrade() switches a target space to a cheaper shading type and hides its overlays, remembering its own
+    settings. A timer restores them once keep_downgraded() wasn't called for `idle_time` seconds, so the targets
+    only draw at full cost again once navigation has stopped.
+    """
+
+    def __init__(self, shading_type: str = "SOLID", hide_overlays: bool = True, idle_time: float = 0.3):
+        """
+        Args:
+            shading_type (str): shading type used while navigating, targets with cheaper shading keep theirs
+            hide_overlays (bool): whether to hide overlays while navigating
+            idle_time (float): seconds without changes before the targets are restored
+        """
+        self._shading_cost: int = SHADING_COST[shading_type]
+        self._shading_type: str = shading_type
+        self._hide_overlays: bool = hide_overlays
+        self._idle_time: float = idle_time
+        # Settings of each downgraded space before it was downgraded {space : (shading type, show overlays)}
+        self._saved: Dict[bpy.types.Space, Tuple[str, bool]] = dict()
+        self._last_downgrade: float = 0.0
+        self._restore_callback: Callable[[], Optional[float]] = self.__restore_when_idle
+
+    def configure(self, shading_type: str, hide_overlays: bool, idle_time: float) -> None:
+        """
+        Change the navigation settings, spaces that are currently downgraded keep the previous ones until restored
+
+        Args:
+            shading_type (str): shading type used while navigating
+            hide_overlays (bool): whether to hide overlays while navigating
+            idle_time (float): seconds without changes before the targets are restored
+        """
+        self._shading_cost = SHADING_COST[shading_type]
+        self._shading_type = shading_type
+        self._hide_overlays = hide_overlays
+        self._idle_time = idle_time
+
+    def downgrade(self, space: bpy.types.Space) -> None:
+        """
+        Switch a space to the navigation settings if it isn't already. Removed spaces are skipped.
+
+        Args:
+            space (bpy.types.Space): space that is being synced to a navigated view
+        """
+        if space in self._saved:
+            return
+        try:
+            shading, overlay = space.shading, space.overlay
+            settings = (shading.type, overlay.show_overlays)
+        except ReferenceError:
+            return
+        self._saved[space] = settings
+        if SHADING_COST.get(settings[0], 0) > self._shading_cost:
+            shading.type = self._shading_type
+        if self._hide_overlays:
+            overlay.show_overlays = False
+
+    def keep_downgraded(self) -> None:
+        """
+        Restart the idle period after which downgraded spaces are restored, called once per synced change
+        """
+        self._last_downgrade = time.perf_counter()
+        if self._saved and not bpy.app.timers.is_registered(self._restore_callback):
+            bpy.app.timers.register(self._restore_callback, first_interval=self._idle_time)
+
+    def restore_space(self, space: bpy.types.Space) -> None:
+        """
+        Restore the settings of a single space if it's downgraded, e.g. because it's no longer synced
+
+        Args:
+            space (bpy.types.Space): space to restore
+        """
+        settings = self._saved.pop(space, None)
+        if settings is not None:
+            self.__apply(space, settings)
+
+    def forget(self, space: bpy.types.Space) -> None:
+        """
+        Drop the saved settings of a space without restoring them, for spaces that were removed
+
+        Args:
+            space (bpy.types.Space): removed space
+        """
+        self._saved.pop(space, None)
+
+    def restore(self) -> None:
+        """
+        Restore every downgraded space and stop the idle timer
+        """
+        saved, self._saved = self._saved, dict()
+        for space, settings in saved.items():
+            self.__apply(space, settings)
+        if bpy.app.timers.is_registered(self._restore_callback):
+            bpy.app.timers.unregister(self._restore_callback)
+
+    @staticmethod
+    def __apply(space: bpy.types.Space, settings: Tuple[str, bool]) -> None:
+        try:
+            space.shading.type, space.overlay.show_overlays = settings
+        except ReferenceError:
+            # The space was removed while it was downgraded
+            pass
+
+    def __restore_when_idle(self) -> Optional[float]:
+        """
+        Timer callback restoring every downgraded space once the idle period has passed without a downgrade
+
+        Returns:
+            Optional[float]: seconds until the next tick, None to unregister the timer
+        """
+        remaining = self._last_downgrade + self._idle_time - time.perf_counter()
+        if remaining > 0.0:
+            return remaining
+        saved, self._saved = self._saved, dict()
+        for space, settings in saved.items():
+            self.__apply(space, settings)
+        return None
@@ -1,26 +1,70 @@
 import bpy
-from .sync_handler import SyncDrawHandler
+from bpy.props import StringProperty
 from .utils.registration import register_classes, unregister_classes
 import logging
+import time
+
+# Events that start navigating a 3D viewport in the default keymap, with any modifier: orbit, pan and zoom with the
+# mouse, trackpad and NDOF devices, the navigation gizmo, numpad views, frame all/selected and the view pie
+NAVIGATION_EVENTS = (
+    ('MIDDLEMOUSE', 'PRESS'), ('LEFTMOUSE', 'PRESS'), ('WHEELUPMOUSE', 'PRESS'), ('WHEELDOWNMOUSE', 'PRESS'),
+    ('WHEELINMOUSE', 'PRESS'), ('WHEELOUTMOUSE', 'PRESS'), ('TRACKPADPAN', 'ANY'), ('TRACKPADZOOM', 'ANY'),
+    ('NDOF_MOTION', 'ANY'), ('NUMPAD_0', 'PRESS'), ('NUMPAD_1', 'PRESS'), ('NUMPAD_2', 'PRESS'),
+    ('NUMPAD_3', 'PRESS'), ('NUMPAD_4', 'PRESS'), ('NUMPAD_5', 'PRESS'), ('NUMPAD_6', 'PRESS'),
+    ('NUMPAD_7', 'PRESS'), ('NUMPAD_8', 'PRESS'), ('NUMPAD_9', 'PRESS'), ('NUMPAD_PERIOD', 'PRESS'),
+    ('NUMPAD_PLUS', 'PRESS'), ('NUMPAD_MINUS', 'PRESS'), ('NUMPAD_SLASH', 'PRESS'), ('HOME', 'PRESS'),
+    ('ACCENT_GRAVE', 'PRESS'),
+)
 
 
 class SYNC_VIEW_EVENTKEYMAP_OT_mouse_move(bpy.types.Operator):
     """
     This operator reports the active area to our draw handler, is meant to be called through a keymap on mouse move
     Adapted from https://blender.stackexchange.com/questions/267285/alternative-to-modal-operators-blocked-autosave
+
+    Mouse moves are reported at the mouse's polling rate, so poll() only passes when the mouse entered a different
+    area or window than the one last reported. A failed poll lets the event pass through without an operator
+    instance being created, which makes moving the mouse within the same area cost two comparisons.
     """
     bl_idname = "syncview.report_active_area"
     bl_label = "Report Active Area"
 
     @classmethod
     def poll(cls, context):
-        return context and context.area
+        if not context or not context.area:
+            return False
+        sync_view = bpy.app.driver_namespace.get('sync_view')
+        return sync_view is not None and not sync_view.is_active_area(context.area.spaces.active, context.window)
 
     def execute(self, context: bpy.types.Context):
         if 'sync_view' in bpy.app.driver_namespace:
-            sync_view = bpy.app.driver_namespace['sync_view']
-            sync_view.active_space = context.area.spaces.active
-            sync_view.active_window = context.window
+            bpy.app.driver_namespace['sync_view'].report_active_area(context.area.spaces.active, context.window)
+
+        return {'PASS_THROUGH'}
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        return self.execute(context)
+
+
+class SYNC_VIEW_EVENTKEYMAP_OT_navigation(bpy.types.Operator):
+    """
+    This operator reports that the active viewport may be navigated, is meant to be called through keymap items
+    on the events that start navigation, so the draw handler compares its view until it stops changing.
+
+    poll() only passes while event detection is enabled and the view isn't already being compared, so with it
+    disabled navigation events cost a failed poll, and execute() passes the event through to the navigation operators.
+    """
+    bl_idname = "syncview.report_navigation"
+    bl_label = "Report Navigation"
+
+    @classmethod
+    def poll(cls, context):
+        sync_view = bpy.app.driver_namespace.get('sync_view')
+        return sync_view is not None and sync_view.is_waiting_for_view_change()
+
+    def execute(self, context: bpy.types.Context):
+        if 'sync_view' in bpy.app.driver_namespace:
+            bpy.app.driver_namespace['sync_view'].mark_view_dirty()
 
         return {'PASS_THROUGH'}
 
@@ -42,7 +86,11 @@ class SYNC_VIEW_OT_EnableSync(bpy.types.Operator):
         if 'sync_view' not in driver_namespace:
             logger = logging.getLogger(__name__ + "." + __class__.__name__)
             logger.info("Adding SyncDrawHandler to driver_namespace['sync_view']")
+            start = time.perf_counter()
+            # Imported here so files that never sync don't load the handler and numpy
+            from .sync_handler import SyncDrawHandler
             driver_namespace['sync_view'] = SyncDrawHandler()
+            logger.info("Enabled sync in %.2f ms", (time.perf_counter() - start) * 1e3)
 
         return {'FINISHED'}
 
@@ -117,11 +165,103 @@ class SYNC_VIEW_OT_StopSync(bpy.types.Operator):
         return self.execute(context)
 
 
+class SYNC_VIEW_OT_ExportProfile(bpy.types.Operator):
+    """Export the collected sync timings to a JSON or CSV file"""
+    bl_idname = "syncview.export_profile"
+    bl_label = "Export Profile"
+
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return 'sync_view' in bpy.app.driver_namespace and bpy.app.driver_namespace['sync_view'].stats is not None
+
+    def execute(self, context):
+        bpy.app.driver_namespace['sync_view'].stats.dump(bpy.path.abspath(self.filepath))
+        self.report({'INFO'}, "Exported sync profile to " + self.filepath)
+
+        return {'FINISHED'}
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        if not self.filepath:
+            self.filepath = "sync_view_profile.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class SYNC_VIEW_OT_ResetProfile(bpy.types.Operator):
+    """Discard the collected sync timings"""
+    bl_idname = "syncview.reset_profile"
+    bl_label = "Reset Profile"
+
+    @classmethod
+    def poll(cls, context):
+        return 'sync_view' in bpy.app.driver_namespace and bpy.app.driver_namespace['sync_view'].stats is not None
+
+    def execute(self, context):
+        bpy.app.driver_namespace['sync_view'].set_profiling(True)
+
+        return {'FINISHED'}
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        return self.execute(context)
+
+
+class SYNC_VIEW_OT_StartTrace(bpy.types.Operator):
+    """Record draw callbacks, active viewport changes and views to a trace file that the benchmarks can replay"""
+    bl_idname = "syncview.start_trace"
+    bl_label = "Record Trace"
+
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*.synctrace", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return 'sync_view' in bpy.app.driver_namespace and bpy.app.driver_namespace['sync_view'].recorder is None
+
+    def execute(self, context):
+        bpy.app.driver_namespace['sync_view'].start_trace(bpy.path.abspath(self.filepath))
+        self.report({'INFO'}, "Recording sync trace to " + self.filepath)
+
+        return {'FINISHED'}
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        if not self.filepath:
+            self.filepath = "sync_view.synctrace"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class SYNC_VIEW_OT_StopTrace(bpy.types.Operator):
+    """Stop recording and save the trace"""
+    bl_idname = "syncview.stop_trace"
+    bl_label = "Stop Recording"
+
+    @classmethod
+    def poll(cls, context):
+        return 'sync_view' in bpy.app.driver_namespace and bpy.app.driver_namespace['sync_view'].recorder is not None
+
+    def execute(self, context):
+        bpy.app.driver_namespace['sync_view'].stop_trace()
+        self.report({'INFO'}, "Saved sync trace")
+
+        return {'FINISHED'}
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        return self.execute(context)
+
+
 classes = [SYNC_VIEW_OT_EnableSync,
            SYNC_VIEW_OT_DisableSync,
            SYNC_VIEW_OT_SyncAllVisible,
            SYNC_VIEW_OT_StopSync,
-           SYNC_VIEW_EVENTKEYMAP_OT_mouse_move
+           SYNC_VIEW_OT_ExportProfile,
+           SYNC_VIEW_OT_ResetProfile,
+           SYNC_VIEW_OT_StartTrace,
+           SYNC_VIEW_OT_StopTrace,
+           SYNC_VIEW_EVENTKEYMAP_OT_mouse_move,
+           SYNC_VIEW_EVENTKEYMAP_OT_navigation
            ]
 
 
@@ -136,6 +276,10 @@ def register():
 
         keymap_sync_view = keyconfigs_addon.keymaps.new(name="3D View", space_type='VIEW_3D')
         keymap_sync_view.keymap_items.new(idname="syncview.report_active_area", type='MOUSEMOVE', value='ANY', any=True)
+        logger.info("Registering syncview.report_navigation to 3D View keymap")
+        for event_type, value in NAVIGATION_EVENTS:
+            keymap_sync_view.keymap_items.new(idname="syncview.report_navigation", type=event_type, value=value,
+                                              any=True)
 
 
 def unregister():
@@ -153,12 +297,14 @@ def unregister():
     keyconfigs_addon = bpy.context.window_manager.keyconfigs.addon
     if keyconfigs_addon:
         keymap = keyconfigs_addon.keymaps.find("3D View", space_type='VIEW_3D')
-        keymap_item = keymap.keymap_items.find_from_operator(idname="syncview.report_active_area")
+        keymap_items = [keymap_item for keymap_item in keymap.keymap_items
+                        if keymap_item.idname in ("syncview.report_active_area", "syncview.report_navigation")]
 
         logger = logging.getLogger(__name__)
-        logger.info("Removing syncview.report_active_area from 3D View keymap")
+        logger.info("Removing syncview.report_active_area and syncview.report_navigation from 3D View keymap")
 
-        keymap.keymap_items.remove(keymap_item)
+        for keymap_item in keymap_items:
+            keymap.keymap_items.remove(keymap_item)
         keyconfigs_addon.keymaps.remove(keymap)
 
     unregister_classes(classes)
@@ -1,6 +1,7 @@
 import bpy
 from bpy.types import AddonPreferences
-from bpy.props import EnumProperty, BoolProperty
+from bpy.props import EnumProperty, BoolProperty, IntProperty, FloatProperty, StringProperty
+from .utils.viewports import any_viewport_tagged
 
 
 class SyncViewPreferences(AddonPreferences):
@@ -12,8 +13,13 @@ class SyncViewPreferences(AddonPreferences):
         "All": 2
     }
 
+    def config_update(self, context):
+        if 'sync_view' in bpy.app.driver_namespace:
+            bpy.app.driver_namespace['sync_view'].refresh_config(self)
+
     def enum_update(self, context):
         if 'sync_view' in bpy.app.driver_namespace:
+            bpy.app.driver_namespace['sync_view'].refresh_config(self)
             bpy.app.driver_namespace['sync_view'].build_map()
 
     sync_mode: EnumProperty(
@@ -32,18 +38,247 @@ class SyncViewPreferences(AddonPreferences):
         name="Pause Sync",
         description="Temporarily Pause Sync",
         default=False,
+        update=config_update,
     )
 
     sync_playback: BoolProperty(
         name="Sync Playback",
         description="Sync During Playback",
         default=True,
+        update=config_update,
     )
 
     sync_camera_view: BoolProperty(
         name="Sync Camera View",
         description="Sync Viewports in Camera View",
         default=True,
+        update=config_update,
+    )
+
+    camera_sync_mode: EnumProperty(
+        name="Camera View Sync",
+        items=[
+            ("FULL", "Full View", "Sync every view attribute of viewports in camera view"),
+            ("FRAMING", "Framing Only", "Only sync the camera zoom and offset to viewports in camera view, "
+                                        "viewports outside of camera view follow the camera"),
+        ],
+        description="What is synced from a viewport in camera view",
+        default="FULL",
+        update=config_update,
+    )
+
+    use_playback_decimation: BoolProperty(
+        name="Decimate Playback Sync",
+        description="During playback, only sync on some frames instead of on every redraw, "
+                    "and sync the exact view once playback stops",
+        default=False,
+        update=config_update,
+    )
+
+    playback_decimation_mode: EnumProperty(
+        name="Playback Sync Interval",
+        items=[
+            ("FRAMES", "Every Nth Frame", "Sync once every given number of played frames"),
+            ("RATE", "Fixed Rate", "Sync at most the given number of times per second"),
+        ],
+        description="How often to sync during playback",
+        default="FRAMES",
+        update=config_update,
+    )
+
+    playback_frame_step: IntProperty(
+        name="Frame Step",
+        description="Number of played frames per sync",
+        default=4,
+        min=1,
+        soft_max=24,
+        update=config_update,
+    )
+
+    playback_rate: IntProperty(
+        name="Playback Rate",
+        description="Maximum number of syncs per second during playback",
+        default=10,
+        min=1,
+        soft_max=60,
+        update=config_update,
+    )
+
+    use_sync_scheduler: BoolProperty(
+        name="Limit Update Rate",
+        description="Update synced viewports from a timer at a limited rate, skipping intermediate views, "
+                    "instead of every time the active viewport draws",
+        default=False,
+        update=config_update,
+    )
+
+    sync_rate: IntProperty(
+        name="Update Rate",
+        description="Maximum number of times per second synced viewports are updated",
+        default=60,
+        min=1,
+        soft_max=120,
+        update=config_update,
+    )
+
+    use_transport: BoolProperty(
+        name="Sync Other Instances",
+        description="Send the view of the active viewport to other Blender instances on this computer, "
+                    "and apply the views they send to the viewports tagged for sync",
+        default=False,
+        update=config_update,
+    )
+
+    transport_port: IntProperty(
+        name="Port",
+        description="UDP port this instance receives views on",
+        default=27450,
+        min=1024,
+        max=65535,
+        update=config_update,
+    )
+
+    transport_peers: StringProperty(
+        name="Peers",
+        description="Comma separated ports, or host:port addresses, of the instances to send views to",
+        default="",
+        update=config_update,
+    )
+
+    use_change_threshold: BoolProperty(
+        name="Ignore Small Changes",
+        description="Accumulate view changes smaller than the thresholds instead of syncing each of them, "
+                    "the exact view is synced once the view stops changing",
+        default=False,
+        update=config_update,
+    )
+
+    change_threshold_angle: FloatProperty(
+        name="Angle",
+        description="Rotations smaller than this are accumulated",
+        default=0.0017453292519943296,
+        min=0.0,
+        soft_max=0.08726646259971647,
+        subtype='ANGLE',
+        update=config_update,
+    )
+
+    change_threshold_distance: FloatProperty(
+        name="Distance",
+        description="Moves smaller than this fraction of the view distance are accumulated",
+        default=0.001,
+        min=0.0,
+        soft_max=0.05,
+        precision=4,
+        update=config_update,
+    )
+
+    use_frame_budget: BoolProperty(
+        name="Frame Budget",
+        description="Limit the time spent updating low priority viewports per change, they catch up with the "
+                    "latest view in the following frames",
+        default=False,
+        update=config_update,
+    )
+
+    frame_budget_ms: FloatProperty(
+        name="Budget (ms)",
+        description="Milliseconds per change spent updating synced viewports before low priority ones are postponed",
+        default=2.0,
+        min=0.0,
+        soft_max=16.0,
+        update=config_update,
+    )
+
+    use_event_detection: BoolProperty(
+        name="Event-Driven Change Detection",
+        description="Only compare the view of the active viewport while it's being navigated or its view "
+                    "properties changed, instead of on every redraw, e.g. while sculpting",
+        default=False,
+        update=config_update,
+    )
+
+    event_stable_draws: IntProperty(
+        name="Stable Redraws",
+        description="Redraws without a view change after navigation before comparing stops",
+        default=8,
+        min=1,
+        soft_max=60,
+        update=config_update,
+    )
+
+    event_poll_interval: IntProperty(
+        name="Poll Every",
+        description="Compare the view on every Nth redraw anyway, to catch changes made during continuous redraws",
+        default=30,
+        min=1,
+        soft_max=240,
+        update=config_update,
+    )
+
+    use_navigation_lod: BoolProperty(
+        name="Simplify While Navigating",
+        description="Draw synced viewports with cheaper shading and without overlays while the active viewport "
+                    "is navigated, and restore their settings once it stops",
+        default=False,
+        update=config_update,
+    )
+
+    navigation_lod_shading: EnumProperty(
+        name="Navigation Shading",
+        items=[
+            ("WIREFRAME", "Wireframe", "Draw synced viewports in wireframe while navigating", 'SHADING_WIRE', 0),
+            ("SOLID", "Solid", "Draw synced viewports in solid shading while navigating", 'SHADING_SOLID', 1),
+            ("MATERIAL", "Material Preview", "Draw rendered synced viewports in material preview while navigating",
+             'SHADING_TEXTURE', 2),
+        ],
+        description="Most expensive shading synced viewports use while navigating",
+        default=1,
+        update=config_update,
+    )
+
+    navigation_lod_hide_overlays: BoolProperty(
+        name="Hide Overlays",
+        description="Hide the overlays of synced viewports while navigating",
+        default=True,
+        update=config_update,
+    )
+
+    navigation_lod_idle_time: FloatProperty(
+        name="Restore After",
+        description="Seconds without navigation before synced viewports are drawn with their own settings again",
+        default=0.3,
+        min=0.0,
+        soft_max=2.0,
+        subtype='TIME',
+        unit='TIME',
+        update=config_update,
+    )
+
+    def lazy_startup_update(self, context):
+        if self.use_lazy_startup:
+            if 'sync_view' in bpy.app.driver_namespace and not any_viewport_tagged():
+                bpy.ops.syncview.syncview_disable_sync()
+        elif 'sync_view' not in bpy.app.driver_namespace:
+            bpy.ops.syncview.syncview_enable_sync()
+
+    use_lazy_startup: BoolProperty(
+        name="Lazy Startup",
+        description="Only enable sync once a viewport is tagged, and disable it when none is, "
+                    "so files that don't sync don't run a draw callback in every viewport",
+        default=True,
+        update=lazy_startup_update,
+    )
+
+    def profiling_update(self, context):
+        if 'sync_view' in bpy.app.driver_namespace:
+            bpy.app.driver_namespace['sync_view'].set_profiling(self.enable_profiling)
+
+    enable_profiling: BoolProperty(
+        name="Profile Sync",
+        description="Collect timings of the sync draw callback, shown in the Sync View panel",
+        default=False,
+        update=profiling_update,
     )
 
     def draw(self, context):
@@ -53,6 +288,55 @@ class SyncViewPreferences(AddonPreferences):
         row.prop(self, "pause_sync", icon='PAUSE')
         row.prop(self, "sync_playback", icon='PLAY')
         row.prop(self, "sync_camera_view", icon='VIEW_CAMERA')
+        sub_row = row.row()
+        sub_row.active = self.sync_camera_view
+        sub_row.prop(self, "camera_sync_mode", text="")
+        row = layout.row()
+        row.active = self.sync_playback
+        row.prop(self, "use_playback_decimation", icon='NEXT_KEYFRAME')
+        sub_row = row.row()
+        sub_row.active = self.use_playback_decimation
+        sub_row.prop(self, "playback_decimation_mode", text="")
+        if self.playback_decimation_mode == "RATE":
+            sub_row.prop(self, "playback_rate")
+        else:
+            sub_row.prop(self, "playback_frame_step")
+        row = layout.row()
+        row.prop(self, "use_sync_scheduler", icon='TIME')
+        sub_row = row.row()
+        sub_row.active = self.use_sync_scheduler
+        sub_row.prop(self, "sync_rate")
+        row = layout.row()
+        row.prop(self, "use_transport", icon='LINKED')
+        sub_row = row.row()
+        sub_row.active = self.use_transport
+        sub_row.prop(self, "transport_port")
+        sub_row.prop(self, "transport_peers")
+        row = layout.row()
+        row.prop(self, "use_change_threshold", icon='DRIVER_DISTANCE')
+        sub_row = row.row()
+        sub_row.active = self.use_change_threshold
+        sub_row.prop(self, "change_threshold_angle")
+        sub_row.prop(self, "change_threshold_distance")
+        row = layout.row()
+        row.prop(self, "use_frame_budget", icon='SORTTIME')
+        sub_row = row.row()
+        sub_row.active = self.use_frame_budget
+        sub_row.prop(self, "frame_budget_ms")
+        row = layout.row()
+        row.prop(self, "use_event_detection", icon='VIEW_PAN')
+        sub_row = row.row()
+        sub_row.active = self.use_event_detection
+        sub_row.prop(self, "event_stable_draws")
+        sub_row.prop(self, "event_poll_interval")
+        row = layout.row()
+        row.prop(self, "use_navigation_lod", icon='MOD_DECIM')
+        sub_row = row.row()
+        sub_row.active = self.use_navigation_lod
+        sub_row.prop(self, "navigation_lod_shading", text="")
+        sub_row.prop(self, "navigation_lod_hide_overlays")
+        sub_row.prop(self, "navigation_lod_idle_time")
+        layout.prop(self, "use_lazy_startup")
 
 
 def register():
@@ -0,0 +1,72 @@
+import bpy
+import time
+from typing import Callable, Optional, Tuple
+from .view_state import Packet
+
+
+class SyncScheduler:
+    """
+    Rate limited, latest-wins delivery of view packets through bpy.app.timers.
+
+    submit() only records the newest packet and the spaces it should be applied to. A timer applies it at most
+    `rate` times per second, packets submitted in between replace the pending one and are never applied.
+    """
+
+    def __init__(self, apply: Callable[[Packet, Tuple[bpy.types.Space, ...]], None], rate: float = 60.0):
+        """
+        Args:
+            apply (Callable[[Packet, Tuple[bpy.types.Space, ...]], None]): called with a packet and its targets on flush
+            rate (float): maximum number of flushes per second
+        """
+        self._apply = apply
+        self._interval: float = 1.0 / rate
+        self._pending: Optional[Tuple[Packet, Tuple[bpy.types.Space, ...]]] = None
+        self._last_flush: float = float("-inf")
+        # bpy.app.timers identifies timers by function object, so the bound method is created only once
+        self._flush_callback: Callable[[], Optional[float]] = self.__flush
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Set the maximum number of flushes per second
+
+        Args:
+            rate (float): flushes per second, must be greater than zero
+        """
+        self._interval = 1.0 / rate
+
+    def submit(self, packet: Packet, targets: Tuple[bpy.types.Space, ...]) -> None:
+        """
+        Record a packet to be applied on the next flush, replacing any packet that is still pending
+
+        Args:
+            packet (Packet): view to apply
+            targets (Tuple[bpy.types.Space, ...]): spaces to apply the view to
+        """
+        self._pending = (packet, targets)
+        if not bpy.app.timers.is_registered(self._flush_callback):
+            delay = max(0.0, self._last_flush + self._interval - time.perf_counter())
+            bpy.app.timers.register(self._flush_callback, first_interval=delay)
+
+    def cancel(self) -> None:
+        """
+        Drop the pending packet and stop the flush timer
+        """
+        self._pending = None
+        if bpy.app.timers.is_registered(self._flush_callback):
+            bpy.app.timers.unregister(self._flush_callback)
+
+    def __flush(self) -> Optional[float]:
+        """
+        Timer callback applying the pending packet. The timer keeps running while packets keep arriving,
+        and unregisters itself on the first tick without one.
+
+        Returns:
+            Optional[float]: seconds until the next tick, None to unregister the timer
+        """
+        pending = self._pending
+        if pending is None:
+            return None
+        self._pending = None
+        self._last_flush = time.perf_counter()
+        self._apply(*pending)
+        return self._interval
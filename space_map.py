@@ -0,0 +1,203 @@
+import bpy
+from typing import Dict, Iterator, List, Optional, Tuple
+from .utils.viewports import DEFAULT_CHANNEL
+
+# Sync modes, matching SyncViewPreferences.sync_modes
+SYNC_WINDOW = 0
+SYNC_WORKSPACE = 1
+SYNC_ALL = 2
+
+
+class SpaceMap:
+    """
+    Maps every space tagged for sync to a tuple of its workspace and screen {space : (workspace, screen)}.
+
+    Alongside the map, the spaces are indexed by screen, by workspace and all together, and the spaces to sync
+    with a given source are cached per sync mode. The indexes are only updated when membership changes, so
+    finding the targets of a change is a dictionary lookup of a ready-made tuple.
+
+    Maps are copy-on-write: once a map is published to SyncDrawHandler it's never modified, changes are made
+    to a copy() that replaces it. The only exception is the targets cache, which is filled lazily and only
+    ever gains entries that are derived from the map's immutable contents.
+
+    Spaces are also indexed by their sync channel, and only ever target spaces in the same channel. Channels are
+    applied on top of the sync mode, so the targets of a space are the spaces in its sync mode's scope that share
+    its channel. Only spaces outside the default channel are indexed.
+
+    Every map has a generation one higher than the map it was copied from, and every entry records the
+    generation in which it was last added or confirmed, so the entries that went unconfirmed the longest
+    can be evicted first when the map grows too large.
+    """
+
+    def __init__(self, entries: Optional[Dict[bpy.types.Space, Tuple[bpy.types.WorkSpace, bpy.types.Screen]]] = None,
+                 generation: int = 0, channels: Optional[Dict[bpy.types.Space, str]] = None):
+        """
+        Args:
+            entries (Optional[Dict[bpy.types.Space, Tuple[bpy.types.WorkSpace, bpy.types.Screen]]]): initial entries
+            generation (int): generation of the map
+            channels (Optional[Dict[bpy.types.Space, str]]): channels of the entries that aren't in the default channel
+        """
+        self.generation: int = generation
+        self._entries: Dict[bpy.types.Space, Tuple[bpy.types.WorkSpace, bpy.types.Screen]] = dict()
+        self._generations: Dict[bpy.types.Space, int] = dict()
+        self._channels: Dict[bpy.types.Space, str] = dict()
+        # Dictionaries are used as insertion ordered sets
+        self._by_screen: Dict[bpy.types.Screen, Dict[bpy.types.Space, None]] = dict()
+        self._by_workspace: Dict[bpy.types.WorkSpace, Dict[bpy.types.Space, None]] = dict()
+        self._by_channel: Dict[str, Dict[bpy.types.Space, None]] = dict()
+        # Cached targets for each source space, one dictionary per sync mode
+        self._targets: Tuple[Dict[bpy.types.Space, Tuple[bpy.types.Space, ...]], ...] = (dict(), dict(), dict())
+        if entries:
+            for space, (workspace, screen) in entries.items():
+                self.add(space, workspace, screen,
+                         channels.get(space, DEFAULT_CHANNEL) if channels else DEFAULT_CHANNEL)
+
+    def copy(self) -> "SpaceMap":
+        """
+        Returns a copy of this map that can be modified without affecting this one
+        """
+        space_map = SpaceMap(generation=self.generation + 1)
+        space_map._entries = dict(self._entries)
+        space_map._generations = dict(self._generations)
+        space_map._channels = dict(self._channels)
+        space_map._by_channel = {channel: dict(group) for channel, group in self._by_channel.items()}
+        space_map._by_screen = {screen: dict(group) for screen, group in self._by_screen.items()}
+        space_map._by_workspace = {workspace: dict(group) for workspace, group in self._by_workspace.items()}
+        return space_map
+
+    def __contains__(self, space: bpy.types.Space) -> bool:
+        return space in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[bpy.types.Space]:
+        return iter(self._entries)
+
+    def get(self, space: bpy.types.Space) -> Optional[Tuple[bpy.types.WorkSpace, bpy.types.Screen]]:
+        return self._entries.get(space)
+
+    def get_channel(self, space: bpy.types.Space) -> str:
+        return self._channels.get(space, DEFAULT_CHANNEL)
+
+    def add(self, space: bpy.types.Space, workspace: bpy.types.WorkSpace, screen: bpy.types.Screen,
+            channel: str = DEFAULT_CHANNEL) -> None:
+        """
+        Add a space to the map, or move it if it's already mapped to a different workspace, screen or channel.
+        Either way the entry is marked as confirmed in this map's generation.
+
+        Args:
+            space (bpy.types.Space): space to add
+            workspace (bpy.types.WorkSpace): workspace of the space
+            screen (bpy.types.Screen): screen of the space
+            channel (str): sync channel of the space
+        """
+        self._generations[space] = self.generation
+        current = self._entries.get(space)
+        if current is not None:
+            if (current[0] == workspace and current[1] == screen
+                    and self._channels.get(space, DEFAULT_CHANNEL) == channel):
+                return
+            self.__unindex(space, current)
+        self._entries[space] = (workspace, screen)
+        self._by_screen.setdefault(screen, dict())[space] = None
+        self._by_workspace.setdefault(workspace, dict())[space] = None
+        if channel != DEFAULT_CHANNEL:
+            self._channels[space] = channel
+            self._by_channel.setdefault(channel, dict())[space] = None
+        self.__clear_targets()
+
+    def discard(self, space: bpy.types.Space) -> None:
+        """
+        Remove a space from the map if it's in it
+
+        Args:
+            space (bpy.types.Space): space to remove
+        """
+        current = self._entries.pop(space, None)
+        if current is not None:
+            del self._generations[space]
+            self.__unindex(space, current)
+            self.__clear_targets()
+
+    def oldest(self, count: int) -> List[bpy.types.Space]:
+        """
+        Returns the spaces whose entries went unconfirmed for the most generations
+
+        Args:
+            count (int): maximum number of spaces to return
+
+        Returns:
+            List[bpy.types.Space]: spaces, the least recently confirmed first
+        """
+        return sorted(self._generations, key=self._generations.__getitem__)[:count]
+
+    def update_screen(self, screen: bpy.types.Screen, workspace: bpy.types.WorkSpace,
+                      spaces: Dict[bpy.types.Space, str]) -> List[bpy.types.Space]:
+        """
+        Make the given spaces the only ones mapped to screen, adding and removing only the spaces that differ
+
+        Args:
+            screen (bpy.types.Screen): screen to update
+            workspace (bpy.types.WorkSpace): workspace to map the spaces to
+            spaces (Dict[bpy.types.Space, str]): spaces of the screen that are tagged for sync, and their channels
+
+        Returns:
+            List[bpy.types.Space]: spaces that were removed from the map
+        """
+        removed = [space for space in self._by_screen.get(screen, ()) if space not in spaces]
+        for space in removed:
+            self.discard(space)
+        for space, channel in spaces.items():
+            self.add(space, workspace, screen, channel)
+        return removed
+
+    def targets(self, source: bpy.types.Space, sync_mode: int) -> Tuple[bpy.types.Space, ...]:
+        """
+        Returns the spaces that should have the same view as the source space in the given sync mode,
+        which are the spaces in the sync mode's scope that are in the same channel as the source
+
+        Args:
+            source (bpy.types.Space): space that is being synced from, must be in the map
+            sync_mode (int): one of SYNC_WINDOW, SYNC_WORKSPACE or SYNC_ALL, anything else is treated as SYNC_WINDOW
+
+        Returns:
+            Tuple[bpy.types.Space, ...]: spaces to sync, excluding the source
+        """
+        if sync_mode != SYNC_WORKSPACE and sync_mode != SYNC_ALL:
+            sync_mode = SYNC_WINDOW
+        cache = self._targets[sync_mode]
+        targets = cache.get(source)
+        if targets is None:
+            workspace, screen = self._entries[source]
+            if sync_mode == SYNC_WINDOW:
+                group = self._by_screen[screen]
+            elif sync_mode == SYNC_WORKSPACE:
+                group = self._by_workspace[workspace]
+            else:
+                group = self._entries
+            channel = self._channels.get(source)
+            if channel is None:
+                channels = self._channels
+                targets = tuple(space for space in group if space != source and space not in channels)
+            else:
+                targets = tuple(space for space in self._by_channel[channel] if space != source and space in group)
+            cache[source] = targets
+        return targets
+
+    def __unindex(self, space: bpy.types.Space, location: Tuple[bpy.types.WorkSpace, bpy.types.Screen]) -> None:
+        workspace, screen = location
+        indexes = [(self._by_workspace, workspace), (self._by_screen, screen)]
+        channel = self._channels.pop(space, None)
+        if channel is not None:
+            indexes.append((self._by_channel, channel))
+        for index, key in indexes:
+            group = index[key]
+            del group[space]
+            if not group:
+                del index[key]
+
+    def __clear_targets(self) -> None:
+        for cache in self._targets:
+            if cache:
+                cache.clear()
@@ -0,0 +1,170 @@
+import csv
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, List
+
+# Phases of the sync hot path
+PHASE_CHANGE_DETECTION = "change_detection"
+PHASE_TARGET_RESOLUTION = "target_resolution"
+PHASE_WRITES = "writes"
+PHASE_REBUILD = "rebuild_space_map"
+PHASES = (PHASE_CHANGE_DETECTION, PHASE_TARGET_RESOLUTION, PHASE_WRITES, PHASE_REBUILD)
+
+# Reasons for sync_draw_callback to return without syncing
+SKIP_UNTAGGED = "untagged"
+SKIP_QUADVIEW = "quadview"
+SKIP_PAUSED = "paused"
+SKIP_PLAYBACK = "playback"
+SKIP_CAMERA_VIEW = "camera_view"
+SKIP_NOT_ACTIVE = "not_active"
+SKIP_UNCHANGED = "unchanged"
+SKIP_BELOW_THRESHOLD = "below_threshold"
+SKIP_ECHO = "echo"
+SKIP_NO_VIEW_EVENT = "no_view_event"
+
+# Upper bounds of the histogram buckets in microseconds, the last bucket has no upper bound
+HISTOGRAM_BOUNDS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """
+    Returns the sample below which the given fraction of samples lies, samples must be sorted and not empty
+    """
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * fraction))]
+
+
+class PhaseTimings:
+    """
+    Timings of one phase: total count, a histogram over all samples,
+    and a rolling window of recent samples for mean, p95 and max
+    """
+    __slots__ = ("count", "histogram", "samples")
+
+    def __init__(self, window: int):
+        self.count: int = 0
+        self.histogram: List[int] = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        microseconds = seconds * 1e6
+        self.count += 1
+        self.histogram[bisect_left(HISTOGRAM_BOUNDS_US, microseconds)] += 1
+        self.samples.append(microseconds)
+
+    def summary(self) -> Dict[str, float]:
+        samples = sorted(self.samples)
+        if not samples:
+            return {"count": self.count, "mean_us": 0.0, "p95_us": 0.0, "max_us": 0.0}
+        return {
+            "count": self.count,
+            "mean_us": sum(samples) / len(samples),
+            "p95_us": percentile(samples, 0.95),
+            "max_us": samples[-1],
+        }
+
+    def histogram_dict(self) -> Dict[str, int]:
+        labels = ["<=%dus" % bound for bound in HISTOGRAM_BOUNDS_US] + [">%dus" % HISTOGRAM_BOUNDS_US[-1]]
+        return dict(zip(labels, self.histogram))
+
+
+class SyncStats:
+    """
+    Rolling counters and timings of the sync hot path.
+
+    SyncDrawHandler only holds an instance of this class while profiling is enabled, so when it's disabled
+    the cost in the hot path is a check against None.
+    """
+
+    def __init__(self, window: int = 512):
+        """
+        Args:
+            window (int): number of recent samples per phase used for mean, p95 and max
+        """
+        self.calls: int = 0
+        self.syncs: int = 0
+        self.targets_written: int = 0
+        self.targets_deferred: int = 0
+        self.targets_postponed: int = 0
+        self.attributes_written: int = 0
+        self.evictions: int = 0
+        self.skips: Dict[str, int] = dict()
+        self.phases: Dict[str, PhaseTimings] = {phase: PhaseTimings(window) for phase in PHASES}
+        self.started: float = time.time()
+        self._lap_start: float = 0.0
+
+    def start(self) -> None:
+        """
+        Count a call of the draw callback and start timing its first phase
+        """
+        self.calls += 1
+        self._lap_start = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """
+        Record the time since start() or the previous lap as the duration of the given phase
+        """
+        now = time.perf_counter()
+        self.phases[phase].add(now - self._lap_start)
+        self._lap_start = now
+
+    def record(self, phase: str, seconds: float) -> None:
+        """
+        Record a duration of the given phase
+        """
+        self.phases[phase].add(seconds)
+
+    def skip(self, reason: str) -> None:
+        """
+        Count a return from the draw callback without syncing
+        """
+        self.skips[reason] = self.skips.get(reason, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {
+            "started": self.started,
+            "duration": time.time() - self.started,
+            "calls": self.calls,
+            "syncs": self.syncs,
+            "targets_written": self.targets_written,
+            "targets_deferred": self.targets_deferred,
+            "targets_postponed": self.targets_postponed,
+            "attributes_written": self.attributes_written,
+            "evictions": self.evictions,
+            "skips": dict(self.skips),
+            "phases": {
+                phase: dict(timings.summary(), histogram=timings.histogram_dict())
+                for phase, timings in self.phases.items()
+            },
+        }
+
+    def dump(self, filepath: str) -> None:
+        """
+        Write the stats to a file, as CSV if the path ends with .csv and as JSON otherwise.
+        CSV files have one name,value row per counter, phase summary value and histogram bucket.
+
+        Args:
+            filepath (str): path of the file to write
+        """
+        stats = self.to_dict()
+        if not filepath.lower().endswith(".csv"):
+            with open(filepath, "w") as file:
+                json.dump(stats, file, indent=2)
+            return
+
+        with open(filepath, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["name", "value"])
+            for name in ("started", "duration", "calls", "syncs", "targets_written", "targets_deferred",
+                         "targets_postponed", "attributes_written", "evictions"):
+                writer.writerow([name, stats[name]])
+            for reason, count in stats["skips"].items():
+                writer.writerow(["skips." + reason, count])
+            for phase, summary in stats["phases"].items():
+                for name, value in summary.items():
+                    if name == "histogram":
+                        for bucket, count in value.items():
+                            writer.writerow(["phases.%s.histogram.%s" % (phase, bucket), count])
+                    else:
+                        writer.writerow(["phases.%s.%s" % (phase, name), value])
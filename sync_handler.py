@@ -1,14 +1,34 @@
 import bpy
-from typing import List, Dict
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 import logging
-import numpy as np
+import time
+from .view_state import ViewState, ViewPacket, FramingPacket, Packet, SPACE_ATTRIBUTES, VIEW_REGION_3D_ATTRIBUTES
+from .space_map import SpaceMap, SYNC_WORKSPACE, SYNC_ALL
+from .scheduler import SyncScheduler
+from .navigation_lod import NavigationLOD
+from .transport import ViewTransport, parse_peers, resolve_peers
+from .config import SyncConfig
+from .trace import TraceRecorder
+from .utils.viewports import (get_viewport_setting, find_area_index, PRIORITY_HIGH, PRIORITY_LOW, DEFAULT_CHANNEL,
+                              VIEWPORT_SETTINGS_KEY)
+from .stats import (SyncStats, PHASE_CHANGE_DETECTION, PHASE_TARGET_RESOLUTION, PHASE_WRITES,
+                    PHASE_REBUILD, SKIP_UNTAGGED, SKIP_QUADVIEW, SKIP_PAUSED, SKIP_PLAYBACK,
+                    SKIP_CAMERA_VIEW, SKIP_NOT_ACTIVE, SKIP_UNCHANGED, SKIP_BELOW_THRESHOLD, SKIP_ECHO,
+                    SKIP_NO_VIEW_EVENT)
 
-SPACE_ATTRIBUTES = ["clip_end", "clip_start", "lens"]
-VIEW_REGION_3D_ATTRIBUTES = ["clip_planes", "is_orthographic_side_view", "is_perspective", "lock_rotation", "use_box_clip", "use_clip_planes",
-                             "view_camera_offset", "view_camera_zoom", "view_distance", "view_location", "view_perspective", "view_rotation"]
-VIEW_REGION_3D_ATTRIBUTES_TO_CHECK = ["is_orthographic_side_view", "is_perspective", "lock_rotation", "use_box_clip", "use_clip_planes",
-                                      "view_camera_zoom"]
-VIEW_REGION_3D_ARRAY_ATTRIBUTES_TO_CHECK = ["clip_planes", "view_camera_offset", "view_matrix"]
+
+# Upper bound on the number of mapped spaces, entries unconfirmed for the longest are evicted beyond it
+MAX_MAPPED_SPACES = 1024
+# Seconds between the catch up ticks writing postponed low priority targets
+CATCH_UP_INTERVAL = 1.0 / 60.0
+# Seconds without a change held back by the thresholds after which the exact view of the active space is synced
+SETTLE_DELAY = 0.15
+# Seconds between checks for the end of playback while playback sync is decimated
+PLAYBACK_POLL_INTERVAL = 0.25
+# Seconds between polls for views sent by other Blender instances
+RECEIVE_INTERVAL = 1.0 / 120.0
+# Seconds without a draw of the active space after which its next draws compare the view, with event detection
+REDRAW_IDLE_GAP = 0.1
 
 
 class SyncDrawHandler:
@@ -30,9 +50,69 @@ class SyncDrawHandler:
         self._handler: object = None
         self._active_window: bpy.types.Window = None
         self._logger: logging.Logger = logging.getLogger(__name__ + ".SyncDrawHandler")
-        self._space_map: Dict[bpy.types.Space, (bpy.types.WorkSpace, bpy.types.Screen)] = dict()
-        self._lock_sync: bool = False  # Rendering is done on a separate thread, this is to prevent race conditions
-        self._last_viewport_attrs: list = []
+        # Published copy-on-write: rebuilds and updates build a new map and replace this reference in one
+        # assignment, so draw callbacks always read a complete map and never have to skip syncing
+        self._space_map: SpaceMap = SpaceMap()
+        # Set once the space map has been fully built, until then update_map() falls back to a full rebuild
+        self._map_complete: bool = False
+        # Workspace the space map was built for in Workspace sync mode
+        self._map_workspace: bpy.types.WorkSpace = None
+        # Two packed view states are swapped instead of reallocated when a change is stored
+        self._current_view: ViewState = ViewState()
+        self._last_view: ViewState = ViewState()
+        self._has_last_view: bool = False
+        # Whether the current and last view only hold the camera framing, captured in camera view with the
+        # FRAMING camera sync mode
+        self._current_framing: bool = False
+        self._last_framing: bool = False
+        # View last written to each target space {space : packet}
+        self._last_written: Dict[bpy.types.Space, Packet] = dict()
+        # Latest view for targets on screens no window shows, written once they're visible {space : packet}
+        self._stale: Dict[bpy.types.Space, Packet] = dict()
+        self._visible_screens: FrozenSet[bpy.types.Screen] = frozenset()
+        # Latest view for low priority targets that didn't fit in the frame budget, in the order they were
+        # postponed, so they're written round-robin {space : packet}
+        self._postponed: Dict[bpy.types.Space, Packet] = dict()
+        # Sync priority of each target, read from its screen's viewport settings on first use {space : priority}
+        self._priorities: Dict[bpy.types.Space, int] = dict()
+        self._catch_up_callback: Callable[[], Optional[float]] = self.__catch_up
+        # Last view held back for being smaller than the thresholds, and the time it was captured
+        self._held_view: ViewState = ViewState()
+        self._last_held_change: float = 0.0
+        self._settle_callback: Callable[[], Optional[float]] = self.__settle
+        # Frames played and time of the last sync while playback sync is decimated
+        self._playback_frames: int = 0
+        self._last_playback_sync: float = 0.0
+        self._playback_end_callback: Callable[[], Optional[float]] = self.__poll_playback_end
+        # Sends views to and receives views from other Blender instances, only set while enabled
+        self._transport: Optional[ViewTransport] = None
+        self._remote_view: ViewState = ViewState()
+        self._receive_callback: Callable[[], Optional[float]] = self.__receive
+        # Set by navigation and view property changes of the active space, cleared once its view was unchanged
+        # for event_stable_draws draws. Only read with event detection enabled, which skips comparing clean views
+        self._view_dirty: bool = True
+        self._stable_draws: int = 0
+        # Draws of a clean view since it was last compared anyway, and time of the last draw of the active space
+        self._draws_since_poll: int = 0
+        self._last_active_draw: float = 0.0
+        # Targets written since they last drew, their next draw is the redraw caused by that write
+        self._echoes: Set[bpy.types.Space] = set()
+        self.suppressed_callbacks: int = 0
+        # Number of spaces evicted from the space map because they were removed or the map was full
+        self.evicted_spaces: int = 0
+        # Used instead of syncing from the draw callback when the update rate is limited
+        self._scheduler: SyncScheduler = SyncScheduler(self.__sync_spaces)
+        # Simplifies the drawing of targets while the active view changes, when enabled
+        self._navigation_lod: NavigationLOD = NavigationLOD()
+        # Only set while profiling is enabled, so the hot path pays a None check when it's not
+        self._stats: Optional[SyncStats] = None
+        # Only set while a trace is recorded, with the path it's saved to
+        self._recorder: Optional[TraceRecorder] = None
+        self._trace_filepath: str = ""
+        preferences = bpy.context.preferences.addons[__package__].preferences
+        self._config: SyncConfig = SyncConfig()
+        self.refresh_config(preferences)
+        self.set_profiling(preferences.enable_profiling)
         self.__add_handler()
 
     def set_active_window(self, new_window: bpy.types.Window) -> None:
@@ -43,14 +123,94 @@ class SyncDrawHandler:
         Args:
             new_window (bpy.types.Window): new window object to be stored
         """
-        self._lock_sync = True
         if self._active_window != new_window:
             self.__rebuild_space_map(new_window)
-        self._lock_sync = False
         self._active_window = new_window
 
     active_window = property(fset=set_active_window)
 
+    def is_active_area(self, space: bpy.types.Space, window: bpy.types.Window) -> bool:
+        """
+        Returns if the given space and window are the ones already reported as active
+
+        Args:
+            space (bpy.types.Space): space under the mouse
+            window (bpy.types.Window): window under the mouse
+
+        Returns:
+            bool: If nothing needs to be reported
+        """
+        return space == self.active_space and window == self._active_window
+
+    def report_active_area(self, space: bpy.types.Space, window: bpy.types.Window) -> None:
+        """
+        Store the space and window the user is working in, touching only what changed
+
+        Args:
+            space (bpy.types.Space): space under the mouse
+            window (bpy.types.Window): window under the mouse
+        """
+        if self._recorder is not None:
+            self._recorder.active(space, window)
+        if space != self.active_space:
+            self.active_space = space
+            # The user navigates the new active space directly, views queued for it as a target are outdated
+            self._postponed.pop(space, None)
+            self._stale.pop(space, None)
+            self.mark_view_dirty()
+        if window != self._active_window:
+            self.set_active_window(window)
+
+    def mark_view_dirty(self) -> None:
+        """
+        Compare the view of the active space on its next draws, until it's unchanged for event_stable_draws draws.
+        Called when a navigation event reaches a 3D viewport and when a view property changes through RNA.
+        """
+        if self._recorder is not None:
+            self._recorder.view_dirty()
+        self._view_dirty = True
+        self._stable_draws = 0
+
+    def is_waiting_for_view_change(self) -> bool:
+        """
+        Returns if event detection is enabled and the view of the active space isn't marked dirty,
+        so navigation events and view property changes need to be reported
+        """
+        return self._config.use_event_detection and not self._view_dirty
+
+    @staticmethod
+    def __may_change_unobserved(space: bpy.types.Space) -> bool:
+        """
+        Returns if the view of a space can change without navigation or an RNA notification,
+        because it follows a locked object, the 3D cursor or the scene camera
+
+        Args:
+            space (bpy.types.Space): active space
+        """
+        return (space.lock_object is not None or space.lock_cursor
+                or space.region_3d.view_perspective == 'CAMERA')
+
+    @staticmethod
+    def __tagged_spaces(screen: bpy.types.Screen) -> Dict[bpy.types.Space, str]:
+        """
+        Returns the active spaces of the screen's 3D viewports that are tagged for sync, and their channels
+
+        Args:
+            screen (bpy.types.Screen): screen to search
+
+        Returns:
+            Dict[bpy.types.Space, str]: tagged spaces mapped to their sync channels
+        """
+        spaces = dict()
+        # Most screens have no viewport settings, their viewports are all in the default channel
+        has_settings = VIEWPORT_SETTINGS_KEY in screen
+        for index, area in enumerate(screen.areas):
+            active_space = area.spaces.active
+            if area.type == 'VIEW_3D' and active_space and active_space.region_3d.show_sync_view:
+                spaces[active_space] = (get_viewport_setting(screen, index, "channel", DEFAULT_CHANNEL)
+                                        if has_settings else DEFAULT_CHANNEL)
+        return spaces
+
     def __rebuild_space_map_window(self, window: bpy.types.Window) -> None:
         """
         Rebuild the space map for each viewport in the window tagged for sync
@@ -58,27 +218,29 @@ class SyncDrawHandler:
         Args:
             window (bpy.types.Window): window to have viewports synced in
         """
+        # No area reported the active window yet, the map is built once one does
+        if window is None:
+            return
         if "sync_view.do_not_sync" not in window.screen:
-            self._space_map = {
-                area.spaces.active: (window.workspace, window.screen)
-                for area in window.screen.areas
-                if area.type == 'VIEW_3D' and area.spaces.active.region_3d.show_sync_view
-            }
+            channels = self.__tagged_spaces(window.screen)
+            self.__publish(SpaceMap({
+                space: (window.workspace, window.screen) for space in channels
+            }, self._space_map.generation + 1, channels))
 
     def __rebuild_space_map(self, window: bpy.types.Window) -> None:
         """
         Clear and rebuild the space map depending on the current sync mode.
         Uses window argument when in window sync mode.
 
-        This populates _space_map with key value pairs that maps a space to
+        This replaces _space_map with a SpaceMap that maps a space to
         a tuple containing its workspace and screen{space : (workspace, screen)}
 
         Args:
             window (bpy.types.Window): window to have viewports synced in
         """
-        preferences = bpy.context.preferences.addons[__package__].preferences
-        sync_mode = preferences.sync_modes[preferences.sync_mode]
-        match sync_mode:
+        if self._stats is not None:
+            start = time.perf_counter()
+        match self._config.sync_mode:
             # Window Sync
             case 0:
                 self.__rebuild_space_map_window(window)
@@ -86,11 +248,13 @@ class SyncDrawHandler:
             case 1:
                 # Rebuild the space map for each viewport in the current workspace tagged for sync
                 new_spacemap = dict()
+                channels = dict()
 
                 # Use the workspace of an open window instead of bpy.context.workspace
                 # because for some reason those two can be different
                 workspace_window_any = bpy.context.window_manager.windows[0]
                 workspace, screens = workspace_window_any.workspace, workspace_window_any.workspace.screens
+                self._map_workspace = workspace
 
                 valid_screens = {
                     window.screen for window in bpy.context.window_manager.windows
@@ -98,17 +262,17 @@ class SyncDrawHandler:
                 }
                 for screen in screens:
                     if screen in valid_screens and hasattr(screen, "areas"):
-                        for area in screen.areas:
-                            active_space = area.spaces.active
-                            if area.type == 'VIEW_3D' and active_space and active_space.region_3d.show_sync_view:
-                                new_spacemap[active_space] = (workspace, screen)
+                        for space, channel in self.__tagged_spaces(screen).items():
+                            new_spacemap[space] = (workspace, screen)
+                            channels[space] = channel
                     else:  # These should be screens that are closed in the current workspace
                         screen["sync_view.do_not_sync"] = True
-                self._space_map = new_spacemap
+                self.__publish(SpaceMap(new_spacemap, self._space_map.generation + 1, channels))
             # All Sync
             case 2:
                 # Rebuild the space map for all viewport in the blend file tagged for sync
                 new_spacemap = dict()
+                channels = dict()
 
                 # Use the workspace of an open window instead of bpy.context.workspace
                 # because for some reason those two can be different
@@ -129,16 +293,27 @@ class SyncDrawHandler:
                 for workspace in bpy.context.blend_data.workspaces:
                     for screen in workspace.screens:
                         if screen in screens and hasattr(screen, "areas"):
-                            for area in screen.areas:
-                                active_space = area.spaces.active
-                                if area.type == 'VIEW_3D' and active_space and active_space.region_3d.show_sync_view:
-                                    new_spacemap[active_space] = (workspace_window_any.workspace, screen)
+                            for space, channel in self.__tagged_spaces(screen).items():
+                                new_spacemap[space] = (workspace_window_any.workspace, screen)
+                                channels[space] = channel
                         else:  # These should be screens that are closed in the current workspace
                             screen["sync_view.do_not_sync"] = True
-                self._space_map = new_spacemap
+                self.__publish(SpaceMap(new_spacemap, self._space_map.generation + 1, channels))
             case _:
                 self.__rebuild_space_map_window(window)
 
+        # Spaces may have been navigated on their own while they were not synced
+        self._last_written.clear()
+        self._echoes.clear()
+        self._stale = {space: packet for space, packet in self._stale.items() if space in self._space_map}
+        self._postponed = {space: packet for space, packet in self._postponed.items() if space in self._space_map}
+        self._priorities.clear()
+        self.__refresh_visible_screens()
+        self._map_complete = True
+
+        if self._stats is not None:
+            self._stats.record(PHASE_REBUILD, time.perf_counter() - start)
+
     # Handler order: PRE_VIEW, POST_VIEW, POST_PIXEL
 
     def __add_handler(self) -> None:
@@ -154,166 +329,827 @@ class SyncDrawHandler:
         """
         self._logger.info("Removing sync view draw handler")
         bpy.types.SpaceView3D.draw_handler_remove(self._handler, 'WINDOW')
+        self._scheduler.cancel()
+        for callback in (self._catch_up_callback, self._settle_callback, self._playback_end_callback):
+            if bpy.app.timers.is_registered(callback):
+                bpy.app.timers.unregister(callback)
+        self._navigation_lod.restore()
+        self.__close_transport()
+        if self._recorder is not None:
+            self.stop_trace()
         self._handler = None
 
     def __has_viewport_changed(self, space: bpy.types.Space) -> bool:
         """
-        Returns if the given space has a different view than the stored view data in _last_viewport_attrs
+        Returns if the given space has a different view than the stored view in _last_view.
+        The view of the space is captured into _current_view, so it can be stored without being read again.
+        With the FRAMING camera sync mode, only the camera framing is captured and compared in camera view.
 
         Args:
             space (bpy.types.Space): space to check the stored view data against
 
         Returns:
-            bool: If the given space has a different view than the stored view data in _last_viewport_attrs
+            bool: If the given space has a different view than the stored view data in _last_view
         """
-        if not self._last_viewport_attrs:
+        if not self._has_last_view:
             return False
-        view_port_attrs_index = 0
-        for attr in SPACE_ATTRIBUTES:
-            if getattr(space, attr, None) != self._last_viewport_attrs[view_port_attrs_index]:
-                return True
-            view_port_attrs_index += 1
-        for attr in VIEW_REGION_3D_ATTRIBUTES_TO_CHECK:
-            if getattr(space.region_3d, attr, None) != self._last_viewport_attrs[view_port_attrs_index]:
-                return True
-            view_port_attrs_index += 1
-        for attr in VIEW_REGION_3D_ARRAY_ATTRIBUTES_TO_CHECK:
-            if not np.allclose(np.array(getattr(space.region_3d, attr, None)), self._last_viewport_attrs[view_port_attrs_index]):
-                return True
-            view_port_attrs_index += 1
-        return False
-
-    # Storing these attributes are inepensive, seems to be sub nanoseconds on a Ryzen 5900X
-    def __store_viewport_attrs(self, space: bpy.types.Space) -> None:
-        """
-        Stores the space's view data in _last_viewport_attrs in the order of attributes in
-        SPACE_ATTRIBUTES, VIEW_REGION_3D_ATTRIBUTES_TO_CHECK, and
-        VIEW_REGION_3D_ARRAY_ATTRIBUTES_TO_CHECK
+        # In camera view the framing is all that's synced with the FRAMING camera sync mode, so it's all that's read
+        if self._config.camera_sync_mode == "FRAMING" and space.region_3d.view_perspective == 'CAMERA':
+            self._current_view.capture_framing(space)
+            self._current_framing = True
+            return not self._last_framing or not self._current_view.matches_framing(self._last_view)
+        self._current_view.capture(space)
+        self._current_framing = False
+        # The rest of a framing view is left over from older captures, so it can't be compared
+        return self._last_framing or not self._current_view.matches(self._last_view)
 
-        Args:
-            space (bpy.types.Space): space to have its view attributes stored
+    def __store_viewport_attrs(self) -> None:
         """
-        self._last_viewport_attrs = [getattr(space, attr, None) for attr in SPACE_ATTRIBUTES]
-        self._last_viewport_attrs += [getattr(space.region_3d, attr, None) for attr in VIEW_REGION_3D_ATTRIBUTES_TO_CHECK]
-        self._last_viewport_attrs += [np.array(getattr(space.region_3d, attr, None)) for attr in VIEW_REGION_3D_ARRAY_ATTRIBUTES_TO_CHECK]
+        Stores the view captured by the last call to __has_viewport_changed in _last_view,
+        by swapping the two preallocated view states
+        """
+        self._last_view, self._current_view = self._current_view, self._last_view
+        self._last_framing = self._current_framing
+        self._has_last_view = True
 
-    def __update_space(self, target_space: bpy.types.Space) -> None:
+    def __update_space(self, target_space: bpy.types.Space, packet: Packet) -> int:
         """
-        Updates target_space so that it has the same view as the stored active space
+        Updates target_space so that it has the view held by packet.
+        Only attributes that differ from what was last written to target_space are written,
+        since every RNA write can tag the target for a redraw.
 
         Args:
             target_space (bpy.types.Space): space to update the view to
+            packet (Packet): view or camera framing captured from the active space
+
+        Returns:
+            int: number of attributes written
+        """
+        if packet.__class__ is FramingPacket:
+            return self.__update_framing(target_space, packet)
+        last_written = self._last_written.get(target_space)
+        region_3d = target_space.region_3d
+        written = 0
+        if last_written is None or last_written.__class__ is not ViewPacket:
+            for attribute, value in zip(SPACE_ATTRIBUTES, packet.space_values):
+                setattr(target_space, attribute, value)
+            for attribute, value in zip(VIEW_REGION_3D_ATTRIBUTES, packet.region_3d_values):
+                setattr(region_3d, attribute, value)
+            written = len(SPACE_ATTRIBUTES) + len(VIEW_REGION_3D_ATTRIBUTES)
+        else:
+            for attribute, value, last_value in zip(SPACE_ATTRIBUTES, packet.space_values, last_written.space_values):
+                if value != last_value:
+                    setattr(target_space, attribute, value)
+                    written += 1
+            for attribute, value, last_value in zip(VIEW_REGION_3D_ATTRIBUTES, packet.region_3d_values,
+                                                    last_written.region_3d_values):
+                if value != last_value:
+                    setattr(region_3d, attribute, value)
+                    written += 1
+        self._last_written[target_space] = packet
+        return written
+
+    def __update_framing(self, target_space: bpy.types.Space, packet: FramingPacket) -> int:
+        """
+        Updates target_space to the camera framing held by packet. Targets in camera view get the camera zoom and
+        offset, other targets get the camera's view matrix. Only values that differ from what was last written
+        to target_space are written.
+
+        Args:
+            target_space (bpy.types.Space): space to update the framing of
+            packet (FramingPacket): camera framing captured from the active space
+
+        Returns:
+            int: number of attributes written
+        """
+        last_written = self._last_written.get(target_space)
+        if last_written.__class__ is not FramingPacket:
+            last_written = None
+        region_3d = target_space.region_3d
+        written = 0
+        if region_3d.view_perspective == 'CAMERA':
+            if last_written is None or packet.view_camera_zoom != last_written.view_camera_zoom:
+                region_3d.view_camera_zoom = packet.view_camera_zoom
+                written += 1
+            if last_written is None or packet.view_camera_offset != last_written.view_camera_offset:
+                region_3d.view_camera_offset = packet.view_camera_offset
+                written += 1
+        elif last_written is None or packet.view_matrix != last_written.view_matrix:
+            region_3d.view_matrix = packet.view_matrix
+            written += 1
+        self._last_written[target_space] = packet
+        return written
+
+    def __sync_spaces(self, packet: Packet, spaces: Tuple[bpy.types.Space, ...]) -> None:
         """
-        def copy_attributes(source: object, target: object, attributes: List[str]) -> None:
-            """
-            Copy all attribtutes, given as list of strings, from source object to target object
+        Apply a view packet to every space that is still valid and tagged for sync.
+        Spaces on screens that no window shows are marked stale instead, and get the latest view
+        once their screen is shown or they're drawn. Spaces that are no longer valid are evicted.
 
-            Args:
-                source (object): source object to copy attributes from
-                target (object): target object to copy attributes to
-                attributes (List[str]): list of attribute names
-            """
-            for attribute in attributes:
-                new_attribute = getattr(source, attribute, None)
-                if new_attribute is not None:
-                    setattr(target, attribute, new_attribute)
+        With the frame budget enabled, low priority spaces are postponed and only written while the budget
+        allows, the ones that don't fit catch up from a timer.
 
-        # Update space attributes
-        copy_attributes(self.active_space, target_space, SPACE_ATTRIBUTES)
+        With navigation LOD enabled, every space that is written or postponed is downgraded until changes stop.
 
-        # Update ViewRegion3D attributes
-        copy_attributes(self.active_space.region_3d, target_space.region_3d, VIEW_REGION_3D_ATTRIBUTES)
+        Args:
+            packet (Packet): view or camera framing captured from the active space
+            spaces (Tuple[bpy.types.Space, ...]): spaces to sync
+        """
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+        space_map = self._space_map
+        visible_screens = self._visible_screens
+        use_frame_budget = self._config.use_frame_budget
+        if use_frame_budget:
+            deadline = time.perf_counter() + self._config.frame_budget
+            postponed = self._postponed
+        navigation_lod = self._navigation_lod if self._config.use_navigation_lod else None
+        active_space = self.active_space
+        targets_written = 0
+        targets_deferred = 0
+        targets_postponed = 0
+        attributes_written = 0
+        removed = None
+        # Cleanup of invalid spaces is done here by using .region_3d to check if the viewport is still valid,
+        # accessing a removed space raises a ReferenceError
+        for space in spaces:
+            try:
+                region_3d = space.region_3d
+            except ReferenceError:
+                region_3d = None
+            if not region_3d:
+                if removed is None:
+                    removed = []
+                removed.append(space)
+            elif region_3d.show_sync_view:
+                location = space_map.get(space)
+                if location is not None and location[1] not in visible_screens:
+                    self._stale[space] = packet
+                    targets_deferred += 1
+                    continue
+                if navigation_lod is not None and space != active_space:
+                    navigation_lod.downgrade(space)
+                if use_frame_budget:
+                    if self.__priority(space, location) == PRIORITY_LOW:
+                        # Assigning to a postponed space keeps its place in the queue
+                        postponed[space] = packet
+                        targets_postponed += 1
+                        continue
+                    postponed.pop(space, None)
+                written = self.__update_space(space, packet)
+                if written:
+                    self._echoes.add(space)
+                attributes_written += written
+                targets_written += 1
+        if removed:
+            self.__evict(removed)
+        if navigation_lod is not None:
+            navigation_lod.keep_downgraded()
+        if use_frame_budget and self._postponed:
+            postponed_targets, postponed_attributes = self.__write_postponed(deadline, False)
+            targets_written += postponed_targets
+            attributes_written += postponed_attributes
+        if stats is not None:
+            stats.record(PHASE_WRITES, time.perf_counter() - start)
+            stats.syncs += 1
+            stats.targets_written += targets_written
+            stats.targets_deferred += targets_deferred
+            stats.targets_postponed += targets_postponed
+            stats.attributes_written += attributes_written
+
+    def __priority(self, space: bpy.types.Space,
+                   location: Optional[Tuple[bpy.types.WorkSpace, bpy.types.Screen]]) -> int:
+        """
+        Returns the sync priority of a space, read from the viewport settings of its screen the first time
+
+        Args:
+            space (bpy.types.Space): target space
+            location (Optional[Tuple[bpy.types.WorkSpace, bpy.types.Screen]]): the space's entry in the space map
+        """
+        priority = self._priorities.get(space)
+        if priority is None:
+            priority = PRIORITY_HIGH
+            if location is not None:
+                area_index = find_area_index(location[1], space)
+                if area_index >= 0:
+                    priority = get_viewport_setting(location[1], area_index, "priority", PRIORITY_HIGH)
+            self._priorities[space] = priority
+        return priority
+
+    def __write_postponed(self, deadline: float, at_least_one: bool) -> Tuple[int, int]:
+        """
+        Write postponed spaces in the order they were postponed until the deadline has passed.
+        Spaces that were untagged or hidden since are skipped or marked stale.
+        The catch up timer is started if any are left.
+
+        Args:
+            deadline (float): time.perf_counter() value after which no more spaces are written
+            at_least_one (bool): write a space even if the deadline has already passed
+
+        Returns:
+            Tuple[int, int]: number of spaces and of attributes written
+        """
+        postponed = self._postponed
+        targets_written = 0
+        attributes_written = 0
+        removed = []
+        while postponed and (at_least_one or time.perf_counter() < deadline):
+            at_least_one = False
+            space = next(iter(postponed))
+            packet = postponed.pop(space)
+            if space == self.active_space:
+                continue
+            try:
+                region_3d = space.region_3d
+            except ReferenceError:
+                region_3d = None
+            if not region_3d:
+                removed.append(space)
+                continue
+            if not region_3d.show_sync_view:
+                continue
+            location = self._space_map.get(space)
+            if location is not None and location[1] not in self._visible_screens:
+                self._stale[space] = packet
+                continue
+            written = self.__update_space(space, packet)
+            if written:
+                self._echoes.add(space)
+            attributes_written += written
+            targets_written += 1
+        if removed:
+            self.__evict(removed)
+        if postponed and not bpy.app.timers.is_registered(self._catch_up_callback):
+            bpy.app.timers.register(self._catch_up_callback, first_interval=CATCH_UP_INTERVAL)
+        return targets_written, attributes_written
+
+    def __catch_up(self) -> Optional[float]:
+        """
+        Timer callback writing postponed spaces within the frame budget, at least one per tick,
+        so they converge to the latest view once changes stop
+
+        Returns:
+            Optional[float]: seconds until the next tick, None to unregister the timer
+        """
+        if not self._postponed:
+            return None
+        targets_written, attributes_written = self.__write_postponed(
+            time.perf_counter() + self._config.frame_budget, True)
+        if self._stats is not None:
+            self._stats.targets_written += targets_written
+            self._stats.attributes_written += attributes_written
+        return CATCH_UP_INTERVAL if self._postponed else None
+
+    def __settle(self) -> Optional[float]:
+        """
+        Timer callback syncing the exact view of the active space once the view held back by the thresholds
+        didn't change for SETTLE_DELAY seconds, even if the active space kept redrawing
+
+        Returns:
+            Optional[float]: seconds until the next tick, None to unregister the timer
+        """
+        remaining = self._last_held_change + SETTLE_DELAY - time.perf_counter()
+        if remaining > 0.0:
+            return remaining
+        self.__sync_active_space()
+        return None
+
+    def __sync_active_space(self) -> None:
+        """
+        Sync the exact view of the active space if it changed, from outside of its draw callback
+        """
+        space = self.active_space
+        space_map = self._space_map
+        config = self._config
+        if space is None or space not in space_map or config.pause_sync:
+            return
+        try:
+            if not config.sync_camera_view and space.region_3d.view_perspective == 'CAMERA':
+                return
+            changed = self.__has_viewport_changed(space)
+        except ReferenceError:
+            return
+        if changed:
+            self.__store_viewport_attrs()
+            self.__propagate(space, space_map, config, None)
+
+    @staticmethod
+    def __is_animation_playing() -> bool:
+        return any(window.screen.is_animation_playing for window in bpy.context.window_manager.windows)
+
+    def frame_change(self) -> None:
+        """
+        Called from the frame_change_post handler. With playback decimation enabled, the draw callback doesn't
+        sync during playback, instead the active space is synced here on every Nth played frame or at a fixed rate.
+        A timer syncs the exact view once playback stops.
+        """
+        config = self._config
+        if not config.use_playback_decimation or not config.sync_playback or not self.__is_animation_playing():
+            return
+        self._playback_frames += 1
+        if config.playback_decimation_mode == "RATE":
+            now = time.perf_counter()
+            if now - self._last_playback_sync < 1.0 / config.playback_rate:
+                return
+            self._last_playback_sync = now
+        elif self._playback_frames % config.playback_frame_step:
+            return
+        self.__sync_active_space()
+        if not bpy.app.timers.is_registered(self._playback_end_callback):
+            bpy.app.timers.register(self._playback_end_callback, first_interval=PLAYBACK_POLL_INTERVAL)
+
+    def __poll_playback_end(self) -> Optional[float]:
+        """
+        Timer callback syncing the exact view of the active space once playback has stopped
+
+        Returns:
+            Optional[float]: seconds until the next tick, None to unregister the timer
+        """
+        if self.__is_animation_playing():
+            return PLAYBACK_POLL_INTERVAL
+        self._playback_frames = 0
+        self.__sync_active_space()
+        return None
+
+    def refresh_viewport_settings(self) -> None:
+        """
+        Forget the viewport settings read so far and rebuild the space map with the new channels,
+        called when a viewport's settings are changed
+        """
+        self._priorities.clear()
+        self.build_map()
+
+    def refresh_config(self, preferences: bpy.types.AddonPreferences) -> None:
+        """
+        Replace the snapshot of the addon preferences read by the hot path.
+        Called from the update callbacks of SyncViewPreferences.
+
+        Args:
+            preferences (bpy.types.AddonPreferences): SyncViewPreferences instance
+        """
+        config = self._config = SyncConfig.from_preferences(preferences)
+        self._scheduler.set_rate(config.sync_rate)
+        self._navigation_lod.configure(config.navigation_lod_shading, config.navigation_lod_hide_overlays,
+                                       config.navigation_lod_idle_time)
+        if not config.use_navigation_lod:
+            self._navigation_lod.restore()
+        self.__configure_transport(config)
+        self.mark_view_dirty()
+
+    def __configure_transport(self, config: SyncConfig) -> None:
+        """
+        Open, reconfigure or close the transport to other Blender instances to match the preferences
+
+        Args:
+            config (SyncConfig): new preferences
+        """
+        if not config.use_transport:
+            self.__close_transport()
+            return
+        try:
+            peers = parse_peers(config.transport_peers)
+        except ValueError:
+            self._logger.error("Invalid sync peers '%s', expected ports or host:port separated by commas",
+                               config.transport_peers)
+            return
+        try:
+            peers = resolve_peers(peers)
+        except OSError as error:
+            self._logger.error("Can't resolve sync peers '%s': %s", config.transport_peers, error)
+            return
+        if self._transport is not None and self._transport.port == config.transport_port:
+            self._transport.peers = peers
+            return
+        self.__close_transport()
+        try:
+            self._transport = ViewTransport(config.transport_port, peers)
+        except OSError as error:
+            self._logger.error("Can't receive views on port %d: %s", config.transport_port, error)
+            return
+        self._logger.info("Syncing with other instances on port %d", config.transport_port)
+        bpy.app.timers.register(self._receive_callback, first_interval=RECEIVE_INTERVAL)
+
+    def __close_transport(self) -> None:
+        if bpy.app.timers.is_registered(self._receive_callback):
+            bpy.app.timers.unregister(self._receive_callback)
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def __receive(self) -> Optional[float]:
+        """
+        Timer callback applying the newest view received from another Blender instance to every mapped space,
+        including the active one
+
+        Returns:
+            Optional[float]: seconds until the next tick, None to unregister the timer
+        """
+        transport = self._transport
+        if transport is None:
+            return None
+        if transport.receive(self._remote_view) and not self._config.pause_sync and len(self._space_map):
+            self.__sync_spaces(ViewPacket.from_view_state(self._remote_view), tuple(self._space_map))
+            # The active space now shows the received view, its next draw only records it instead of
+            # sending it back
+            self._has_last_view = False
+        return RECEIVE_INTERVAL
+
+    @property
+    def transport(self) -> Optional[ViewTransport]:
+        return self._transport
+
+    def set_profiling(self, enabled: bool) -> None:
+        """
+        Start or stop collecting stats of the sync hot path. Starting discards previously collected stats.
+
+        Args:
+            enabled (bool): whether to collect stats
+        """
+        self._stats = SyncStats() if enabled else None
+
+    @property
+    def stats(self) -> Optional[SyncStats]:
+        """
+        Stats of the sync hot path, None if profiling is disabled
+        """
+        return self._stats
+
+    def start_trace(self, filepath: str) -> None:
+        """
+        Start recording draw callbacks, active area reports, msgbus notifications and views of the active space,
+        discarding a trace that is already being recorded
+
+        Args:
+            filepath (str): path the trace is saved to by stop_trace()
+        """
+        self._recorder = TraceRecorder(bpy.context.preferences.addons[__package__].preferences)
+        self._trace_filepath = filepath
+        self._logger.info("Recording a sync trace to %s", filepath)
+
+    def stop_trace(self) -> None:
+        """
+        Stop recording and save the trace
+        """
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return
+        recorder.save(self._trace_filepath)
+        self._logger.info("Saved %d trace events to %s", recorder.event_count, self._trace_filepath)
+
+    @property
+    def recorder(self) -> Optional[TraceRecorder]:
+        """
+        Recorder of the current trace, None if no trace is being recorded
+        """
+        return self._recorder
 
     def build_map(self) -> None:
         """
         Build the spacemap with the stored active window
         """
-        self._lock_sync = True
         self.__rebuild_space_map(self._active_window)
-        self._lock_sync = False
+
+    def update_map(self) -> None:
+        """
+        Update the spacemap after a viewport was tagged or untagged for sync, or a window switched workspaces.
+
+        Only the screens shown in windows are rescanned, since those are the only ones whose viewports can be
+        toggled from the UI, and only the spaces that differ are added or removed. Falls back to a full rebuild
+        if the map hasn't been built yet, in Window sync mode where a rebuild only scans one screen anyway,
+        and in Workspace sync mode when the synced workspace changed.
+        """
+        if self._recorder is not None:
+            self._recorder.msgbus()
+        sync_mode = self._config.sync_mode
+        windows = bpy.context.window_manager.windows
+        if not self._map_complete or sync_mode not in (SYNC_WORKSPACE, SYNC_ALL) or not windows:
+            self.build_map()
+            return
+        # Use the workspace of an open window instead of bpy.context.workspace
+        # because for some reason those two can be different
+        workspace = windows[0].workspace
+        if sync_mode == SYNC_WORKSPACE and workspace != self._map_workspace:
+            self.build_map()
+            return
+
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+        space_map = self._space_map.copy()
+        for window in windows:
+            screen = window.screen
+            if "sync_view.do_not_sync" in screen or (sync_mode == SYNC_WORKSPACE and window.workspace != workspace):
+                continue
+            for space in space_map.update_screen(screen, workspace, self.__tagged_spaces(screen)):
+                self._last_written.pop(space, None)
+                self._stale.pop(space, None)
+                self._postponed.pop(space, None)
+        # Areas may have been split or joined, which changes the indices viewport settings are stored by
+        self._priorities.clear()
+        self.__publish(space_map)
+        self.__refresh_visible_screens()
+        self.__flush_stale()
+        if stats is not None:
+            stats.record(PHASE_REBUILD, time.perf_counter() - start)
+
+    def __publish(self, space_map: SpaceMap) -> None:
+        """
+        Replace the space map read by draw callbacks. If the new map holds more than MAX_MAPPED_SPACES entries,
+        the ones that went unconfirmed for the most generations are evicted first.
+
+        Args:
+            space_map (SpaceMap): map that is not published yet
+        """
+        excess = len(space_map) - MAX_MAPPED_SPACES
+        if excess > 0:
+            evicted = space_map.oldest(excess)
+            for space in evicted:
+                space_map.discard(space)
+            self.__forget(evicted)
+            self._logger.warning("Space map is full, evicted %d least recently confirmed spaces", excess)
+        self._space_map = space_map
+
+    def __forget(self, spaces: List[bpy.types.Space]) -> None:
+        """
+        Drop everything stored about spaces that were evicted from the space map, and count the evictions
+
+        Args:
+            spaces (List[bpy.types.Space]): evicted spaces
+        """
+        for space in spaces:
+            self._last_written.pop(space, None)
+            self._stale.pop(space, None)
+            self._postponed.pop(space, None)
+            self._priorities.pop(space, None)
+            self._echoes.discard(space)
+            self._navigation_lod.forget(space)
+        self.evicted_spaces += len(spaces)
+        if self._stats is not None:
+            self._stats.evictions += len(spaces)
+
+    def __evict(self, spaces: List[bpy.types.Space]) -> None:
+        """
+        Evict spaces that were found to be removed, e.g. because their area was closed or their screen deleted
+
+        Args:
+            spaces (List[bpy.types.Space]): removed spaces
+        """
+        space_map = self._space_map.copy()
+        for space in spaces:
+            space_map.discard(space)
+        self.__forget(spaces)
+        self.__publish(space_map)
+        self._logger.info("Evicted %d removed spaces from the space map", len(spaces))
+
+    def __refresh_visible_screens(self) -> None:
+        """
+        Store the screens currently shown in a window
+        """
+        self._visible_screens = frozenset(window.screen for window in bpy.context.window_manager.windows)
+
+    def __flush_stale(self) -> None:
+        """
+        Write the latest view to every stale space whose screen is now shown in a window
+        """
+        if not self._stale:
+            return
+        removed = []
+        for space, packet in list(self._stale.items()):
+            location = self._space_map.get(space)
+            if location is not None and location[1] in self._visible_screens:
+                del self._stale[space]
+                if space == self.active_space:
+                    continue
+                try:
+                    self.__update_space(space, packet)
+                except ReferenceError:
+                    removed.append(space)
+        if removed:
+            self.__evict(removed)
 
     def has_handler(self) -> bool:
         return self._handler is not None
 
+    def has_mapped_spaces(self) -> bool:
+        return len(self._space_map) > 0
+
     def sync_draw_callback(self) -> None:
         """
         Will sync all viewports tagged for sync to the same view as the viewport this
         callback function is called from, if the viewport is tagged for sync.
 
         Will not sync if any of the following conditions are fulfilled, evaluated in order:
+        - The viewport is redrawing because this handler wrote to it, and is not the active space
         - The viewport is not tagged for sync, or there's not recorded active space
         - The current space is in quad view mode
-        - _lock_sync is true, this is to prevent sync while space_map is being rebuilt
         - Addon preferences has pause_sync enabled
-        - Addon preferences has sync_playback disabled and the viewport is playing an animation
+        - Addon preferences has sync_playback disabled or use_playback_decimation enabled,
+          and the viewport is playing an animation
         - Addon preferences has sync_camera_view disabled and the viewport is in camera view
+        - Addon preferences has use_event_detection enabled, the view wasn't marked dirty by navigation, a view
+          property change or the first draws after a pause, can't change otherwise, and this is not one of the
+          draws that poll it anyway
         - self.__has_viewport_changed(bpy.context.space_data) returns false
+        - Addon preferences has use_change_threshold enabled and the change is smaller than the thresholds,
+          in which case the exact view is synced from a timer once the view stops changing
+
+        The addon preferences are read from the snapshot in _config.
+
+        With the FRAMING camera sync mode, a viewport in camera view only compares and syncs its camera framing,
+        see FramingPacket.
+
+        If addon preferences has use_sync_scheduler enabled, the view is handed to the scheduler
+        instead of being written to the other viewports from within this callback.
         """
         this_space = bpy.context.space_data
-        preferences = bpy.context.preferences.addons[__package__].preferences
+        if self._recorder is not None:
+            self._recorder.draw(this_space, this_space == self.active_space)
+        # Redraws caused by writing to a target would only re-register it and find it isn't the active space
+        if this_space in self._echoes and this_space != self.active_space:
+            self._echoes.discard(this_space)
+            self.suppressed_callbacks += 1
+            if self._stats is not None:
+                self._stats.calls += 1
+                self._stats.skip(SKIP_ECHO)
+            return
+
+        stats = self._stats
+        if stats is not None:
+            stats.start()
+
+        config = self._config
 
         if not bpy.context.region_data.show_sync_view or not self.active_space:
-            self._space_map.pop(this_space, None)
+            if this_space in self._space_map:
+                space_map = self._space_map.copy()
+                space_map.discard(this_space)
+                self.__publish(space_map)
+            self._last_written.pop(this_space, None)
+            self._stale.pop(this_space, None)
+            self._postponed.pop(this_space, None)
+            self._navigation_lod.restore_space(this_space)
+            if stats is not None:
+                stats.skip(SKIP_UNTAGGED)
             return
 
         # Disable sync if in quadview to prevent issues
         if len(this_space.region_quadviews) > 1:
             if this_space.region_3d.show_sync_view:
                 this_space.region_3d.show_sync_view = False
+            if stats is not None:
+                stats.skip(SKIP_QUADVIEW)
             return
 
-        if self._lock_sync:
-            return
+        # Viewports that were hidden when a change was synced get the latest view on their first draw,
+        # unless they became the active space since
+        if self._stale:
+            packet = self._stale.pop(this_space, None)
+            if packet is not None and this_space != self.active_space:
+                self.__update_space(this_space, packet)
+        # And postponed low priority viewports that draw anyway don't wait for their turn
+        if self._postponed:
+            packet = self._postponed.pop(this_space, None)
+            if packet is not None and this_space != self.active_space:
+                self.__update_space(this_space, packet)
 
-        if preferences.pause_sync:
+        # The active space can be navigated directly, so what was last written to it is no longer known
+        if this_space == self.active_space:
+            self._last_written.pop(this_space, None)
+
+        if config.pause_sync:
+            if stats is not None:
+                stats.skip(SKIP_PAUSED)
             return
 
-        if bpy.context.screen.is_animation_playing and not preferences.sync_playback:
+        # With playback decimation, frame_change() syncs during playback instead
+        if bpy.context.screen.is_animation_playing and (not config.sync_playback or config.use_playback_decimation):
+            if stats is not None:
+                stats.skip(SKIP_PLAYBACK)
             return
 
-        if not preferences.sync_camera_view and bpy.context.space_data.region_3d.view_perspective == 'CAMERA':
+        if not config.sync_camera_view and bpy.context.space_data.region_3d.view_perspective == 'CAMERA':
+            if stats is not None:
+                stats.skip(SKIP_CAMERA_VIEW)
             return
 
         # Use the workspace of an open window instead of bpy.context.workspace
         # because for some reason those two can be different
-        self._space_map[this_space] = (bpy.context.window_manager.windows[0].workspace, bpy.context.screen)
+        # The space map is only copied and republished if the space is new or has moved
+        space_map = self._space_map
+        workspace, screen = bpy.context.window_manager.windows[0].workspace, bpy.context.screen
+        # A screen that draws is shown in a window, e.g. a window opened after the visible screens were stored
+        if screen not in self._visible_screens:
+            self.__refresh_visible_screens()
+            self.__flush_stale()
+        location = space_map.get(this_space)
+        if location is None or location[0] != workspace or location[1] != screen:
+            area_index = find_area_index(screen, this_space)
+            space_map = space_map.copy()
+            space_map.add(this_space, workspace, screen,
+                          get_viewport_setting(screen, area_index, "channel", DEFAULT_CHANNEL)
+                          if area_index >= 0 else DEFAULT_CHANNEL)
+            self.__publish(space_map)
+            space_map = self._space_map
 
         # Sync other viewports
-        if this_space == self.active_space:
-            if not self._last_viewport_attrs:
-                # Initialize self._last_viewport_attrs
-                self.__store_viewport_attrs(this_space)
-            elif (self.__has_viewport_changed(this_space)):
-                self.__store_viewport_attrs(this_space)
-
-                sync_mode = preferences.sync_modes[preferences.sync_mode]
-
-                spaces_to_sync = set()
-                spaces = self._space_map.keys()
-                # Cleanup invalid spaces
-                # Use .region_3d to check if viewport is still valid
-                match sync_mode:
-                    case 0:  # Window Sync
-                        spaces_to_sync = {
-                            space for space in spaces
-                            if (space.region_3d and self._space_map[space][1] == self._space_map[self.active_space][1])
-                        }
-                    case 1:  # Workspace Sync
-                        spaces_to_sync = {
-                            space for space in spaces
-                            if (space.region_3d and self._space_map[space][0] == self._space_map[self.active_space][0])
-                        }
-                    case 2:  # All Sync
-                        spaces_to_sync = {
-                            space for space in spaces
-                            if space.region_3d
-                        }
-                    case _:  # Default to Window Sync
-                        spaces_to_sync = {
-                            space for space in spaces
-                            if (space.region_3d and self._space_map[space][1] == self._space_map[self.active_space][1])
-                        }
-                spaces_to_sync.remove(this_space)
-                for space in spaces_to_sync:
-                    if space.region_3d.show_sync_view:
-                        self.__update_space(space)
+        if this_space != self.active_space:
+            if stats is not None:
+                stats.skip(SKIP_NOT_ACTIVE)
+            return
+
+        if not self._has_last_view:
+            # Initialize self._last_view
+            self._current_view.capture(this_space)
+            self._current_framing = False
+            self.__store_viewport_attrs()
+            return
+
+        if config.use_event_detection:
+            # Operators run from header menus or scripts change the view without navigation events or RNA
+            # notifications. They redraw a viewport that was idle, so the first draws after a pause are compared.
+            now = time.perf_counter()
+            if now - self._last_active_draw > REDRAW_IDLE_GAP:
+                self.mark_view_dirty()
+            self._last_active_draw = now
+            # Clean views within a burst of redraws, e.g. while sculpting, are only compared on every Nth draw
+            if not self._view_dirty and not self.__may_change_unobserved(this_space):
+                self._draws_since_poll += 1
+                if self._draws_since_poll < config.event_poll_interval:
+                    if stats is not None:
+                        stats.skip(SKIP_NO_VIEW_EVENT)
+                    return
+                self._draws_since_poll = 0
+
+        if not self.__has_viewport_changed(this_space):
+            if self._view_dirty and config.use_event_detection:
+                self._stable_draws += 1
+                if self._stable_draws >= config.event_stable_draws:
+                    self._view_dirty = False
+            if stats is not None:
+                stats.lap(PHASE_CHANGE_DETECTION)
+                stats.skip(SKIP_UNCHANGED)
+            return
+
+        # A changing view keeps being compared until it settles, whether the change was reported or polled
+        self._view_dirty = True
+        self._stable_draws = 0
+
+        # Small changes are compared against the last synced view, so they add up until they exceed the thresholds.
+        # A framing only holds part of a view, so nothing is held back when entering or leaving camera view.
+        if config.use_change_threshold and not self._current_framing and not self._last_framing \
+                and self._current_view.within_threshold(self._last_view, config.change_threshold_angle,
+                                                        config.change_threshold_distance):
+            # Redraws of a view that stopped moving don't push the exact sync back, only further changes do
+            if not self._current_view.matches(self._held_view):
+                self._held_view.buffer[:] = self._current_view.buffer
+                self._last_held_change = time.perf_counter()
+            if not bpy.app.timers.is_registered(self._settle_callback):
+                bpy.app.timers.register(self._settle_callback, first_interval=SETTLE_DELAY)
+            if stats is not None:
+                stats.lap(PHASE_CHANGE_DETECTION)
+                stats.skip(SKIP_BELOW_THRESHOLD)
+            return
+
+        self.__store_viewport_attrs()
+        if stats is not None:
+            stats.lap(PHASE_CHANGE_DETECTION)
+        self.__propagate(this_space, space_map, config, stats)
+
+    def __propagate(self, this_space: bpy.types.Space, space_map: SpaceMap, config: SyncConfig,
+                    stats: Optional[SyncStats]) -> None:
+        """
+        Sync the view stored in _last_view from this_space to its targets
+
+        Args:
+            this_space (bpy.types.Space): space the view was captured from
+            space_map (SpaceMap): space map to find the targets in
+            config (SyncConfig): preferences to sync with
+            stats (Optional[SyncStats]): stats to record the target resolution phase in, if it was timed
+        """
+        # Read the source once, the same packet is applied to every target
+        if self._last_framing:
+            packet = FramingPacket.from_view_state(self._last_view)
+        else:
+            packet = ViewPacket.from_view_state(self._last_view)
+        targets = space_map.targets(this_space, config.sync_mode)
+        if stats is not None:
+            stats.lap(PHASE_TARGET_RESOLUTION)
+
+        if config.use_navigation_lod:
+            # The navigated space may have been a downgraded target until it became active
+            self._navigation_lod.restore_space(this_space)
+
+        if config.use_sync_scheduler:
+            # Only the newest packet is kept, a timer applies it at the configured rate
+            self._scheduler.submit(packet, targets)
+        else:
+            self.__sync_spaces(packet, targets)
+
+        if self._transport is not None:
+            if self._last_framing:
+                # Other instances get the full view, the unused view state is free until the next capture
+                self._current_view.capture(this_space)
+                self._transport.publish(self._current_view)
+            else:
+                self._transport.publish(self._last_view)
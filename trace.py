@@ -0,0 +1,247 @@
+import bpy
+import json
+import struct
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+from .view_state import ViewState, BUFFER_SIZE
+from .preferences import SyncViewPreferences
+from .utils.viewports import VIEWPORT_SETTINGS_KEY
+
+# A trace file is a header followed by the zlib compressed events. The header holds the magic, the format version
+# and the length of a JSON description of the layout and preferences when recording started.
+TRACE_MAGIC = b"SYNT"
+TRACE_VERSION = 2
+TRACE_HEADER = struct.Struct("<4sBI")
+
+# Every event starts with its type and the seconds since recording started
+EVENT_HEADER = struct.Struct("<Bf")
+# A draw callback invocation in a space: space index
+EVENT_DRAW = 0
+# The view of a space when it was drawn as the active space, or when it was first seen: space index, view buffer
+EVENT_VIEW = 1
+# The active area was reported: space index, window index
+EVENT_ACTIVE = 2
+# A msgbus notification: JSON with the spaces whose tag changed and the screen of each window
+EVENT_MSGBUS = 3
+# A space that wasn't known yet: JSON with its screen name, area index and tag
+EVENT_SPACE = 4
+# The view of the active space was marked dirty by navigation or a view property change, added in version 2
+EVENT_VIEW_DIRTY = 5
+
+DRAW_PAYLOAD = struct.Struct("<H")
+VIEW_PAYLOAD = struct.Struct("<H%dd" % BUFFER_SIZE)
+ACTIVE_PAYLOAD = struct.Struct("<HH")
+JSON_PAYLOAD = struct.Struct("<I")
+EMPTY_PAYLOAD = struct.Struct("<")
+
+
+def describe_layout(preferences: bpy.types.AddonPreferences) -> dict:
+    """
+    Describe the open windows, workspaces and screens and the addon preferences, as recorded at the start of a trace
+
+    Args:
+        preferences (bpy.types.AddonPreferences): SyncViewPreferences instance
+
+    Returns:
+        dict: JSON serializable description
+    """
+    context = bpy.context
+    screens = dict()
+    for screen in context.blend_data.screens:
+        settings = screen.get(VIEWPORT_SETTINGS_KEY)
+        screens[screen.name] = {
+            "areas": [area.type for area in screen.areas],
+            "tagged": [index for index, area in enumerate(screen.areas)
+                       if area.type == 'VIEW_3D' and area.spaces.active
+                       and area.spaces.active.region_3d.show_sync_view],
+            "do_not_sync": "sync_view.do_not_sync" in screen,
+            "viewport_settings": {
+                area: dict(values) for area, values in settings.items()
+            } if settings is not None else {},
+        }
+    return {
+        "windows": [{"workspace": window.workspace.name, "screen": window.screen.name}
+                    for window in context.window_manager.windows],
+        "workspaces": [{"name": workspace.name, "screens": [screen.name for screen in workspace.screens]}
+                       for workspace in context.blend_data.workspaces],
+        "screens": screens,
+        "preferences": {name: getattr(preferences, name) for name in SyncViewPreferences.__annotations__},
+    }
+
+
+class TraceRecorder:
+    """
+    Records draw callbacks, active area reports, msgbus notifications and the views of the active space
+    during a session, to be replayed against SyncDrawHandler by the benchmarks.
+
+    Events are appended to an in-memory buffer and only compressed and written to a file by save().
+    Views are only recorded when the active space draws a view that differs from the last one recorded for it.
+    """
+
+    def __init__(self, preferences: bpy.types.AddonPreferences):
+        """
+        Args:
+            preferences (bpy.types.AddonPreferences): SyncViewPreferences instance, recorded with the layout
+        """
+        self.layout: dict = describe_layout(preferences)
+        self.event_count: int = 0
+        self._events: bytearray = bytearray()
+        self._started: float = time.perf_counter()
+        # Index of every space seen so far, in the order they were first seen {space : index}
+        self._spaces: Dict[bpy.types.Space, int] = dict()
+        # Tag of each space when it was last recorded, by index
+        self._space_tags: List[bool] = []
+        self._view: ViewState = ViewState()
+        # Last recorded view of each space {space index : view buffer}
+        self._views: Dict[int, bytes] = dict()
+        # Index of the space last drawn as the active one
+        self._last_active: int = -1
+        self._windows: List[bpy.types.Window] = list(bpy.context.window_manager.windows)
+        for window in self._windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D' and area.spaces.active:
+                    self.__space_index(area.spaces.active, window.screen)
+
+    def __append(self, event_type: int, payload: bytes) -> None:
+        self._events += EVENT_HEADER.pack(event_type, time.perf_counter() - self._started)
+        self._events += payload
+        self.event_count += 1
+
+    def __append_json(self, event_type: int, value: dict) -> None:
+        encoded = json.dumps(value, separators=(",", ":")).encode()
+        self.__append(event_type, JSON_PAYLOAD.pack(len(encoded)) + encoded)
+
+    def __space_index(self, space: bpy.types.Space, screen: Optional[bpy.types.Screen] = None) -> int:
+        """
+        Returns the index of a space, recording it along with its current view the first time it's seen
+        """
+        index = self._spaces.get(space)
+        if index is None:
+            screen = screen or bpy.context.screen
+            area_index = next((area_index for area_index, area in enumerate(screen.areas)
+                               if area.spaces.active == space), -1)
+            index = self._spaces[space] = len(self._space_tags)
+            tagged = bool(space.region_3d.show_sync_view)
+            self._space_tags.append(tagged)
+            self.__append_json(EVENT_SPACE, {"screen": screen.name, "area": area_index, "tagged": tagged})
+            self.__record_view(index, space)
+        return index
+
+    def __record_view(self, index: int, space: bpy.types.Space) -> None:
+        self._view.capture(space)
+        view = self._view.buffer.tobytes()
+        if self._views.get(index) != view:
+            self._views[index] = view
+            self.__append(EVENT_VIEW, VIEW_PAYLOAD.pack(index, *self._view.buffer))
+
+    def draw(self, space: bpy.types.Space, is_active: bool) -> None:
+        """
+        Record a draw callback invocation in the given space
+
+        Args:
+            space (bpy.types.Space): space being drawn
+            is_active (bool): whether the space is the active space, whose view is recorded if it changed
+        """
+        index = self.__space_index(space)
+        if is_active:
+            if index != self._last_active:
+                # Other spaces may have written to it since its view was last recorded
+                self._views.pop(index, None)
+                self._last_active = index
+            self.__record_view(index, space)
+        self.__append(EVENT_DRAW, DRAW_PAYLOAD.pack(index))
+
+    def active(self, space: bpy.types.Space, window: bpy.types.Window) -> None:
+        """
+        Record a report of the active area
+
+        Args:
+            space (bpy.types.Space): reported space
+            window (bpy.types.Window): reported window
+        """
+        index = self.__space_index(space, window.screen)
+        if window not in self._windows:
+            self._windows.append(window)
+        self.__append(EVENT_ACTIVE, ACTIVE_PAYLOAD.pack(index, self._windows.index(window)))
+
+    def view_dirty(self) -> None:
+        """
+        Record that the view of the active space was marked dirty
+        """
+        self.__append(EVENT_VIEW_DIRTY, b"")
+
+    def msgbus(self) -> None:
+        """
+        Record a msgbus notification, along with the tags that changed and the screen each window shows
+        """
+        changed = dict()
+        for space, index in self._spaces.items():
+            try:
+                tagged = bool(space.region_3d.show_sync_view)
+            except (ReferenceError, AttributeError):
+                continue
+            if tagged != self._space_tags[index]:
+                self._space_tags[index] = tagged
+                changed[str(index)] = tagged
+        self.__append_json(EVENT_MSGBUS, {
+            "tags": changed,
+            "windows": [{"workspace": window.workspace.name, "screen": window.screen.name}
+                        for window in bpy.context.window_manager.windows],
+        })
+
+    def save(self, filepath: str) -> None:
+        """
+        Write the trace to a file
+
+        Args:
+            filepath (str): path of the file to write
+        """
+        layout = json.dumps(self.layout).encode()
+        with open(filepath, "wb") as file:
+            file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(layout)))
+            file.write(layout)
+            file.write(zlib.compress(bytes(self._events)))
+
+
+def read_trace(filepath: str) -> Tuple[dict, Iterator[Tuple[int, float, tuple]]]:
+    """
+    Read a trace written by TraceRecorder.save()
+
+    Args:
+        filepath (str): path of the trace
+
+    Returns:
+        Tuple[dict, Iterator[Tuple[int, float, tuple]]]: the layout description, and an iterator of
+        (event type, seconds since the start, payload) tuples where JSON payloads are a one element tuple
+
+    Raises:
+        ValueError: if the file is not a trace of a supported version
+    """
+    with open(filepath, "rb") as file:
+        data = file.read()
+    magic, version, layout_size = TRACE_HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC or not 1 <= version <= TRACE_VERSION:
+        raise ValueError("%s is not a version 1 to %d sync view trace" % (filepath, TRACE_VERSION))
+    offset = TRACE_HEADER.size
+    layout = json.loads(data[offset:offset + layout_size])
+    events = zlib.decompress(data[offset + layout_size:])
+
+    def iterate_events():
+        position = 0
+        payloads = {EVENT_DRAW: DRAW_PAYLOAD, EVENT_VIEW: VIEW_PAYLOAD, EVENT_ACTIVE: ACTIVE_PAYLOAD,
+                    EVENT_VIEW_DIRTY: EMPTY_PAYLOAD}
+        while position < len(events):
+            event_type, seconds = EVENT_HEADER.unpack_from(events, position)
+            position += EVENT_HEADER.size
+            payload = payloads.get(event_type)
+            if payload is not None:
+                yield event_type, seconds, payload.unpack_from(events, position)
+                position += payload.size
+            else:
+                size, = JSON_PAYLOAD.unpack_from(events, position)
+                position += JSON_PAYLOAD.size
+                yield event_type, seconds, (json.loads(events[position:position + size]),)
+                position += size
+
+    return layout, iterate_events()
@@ -0,0 +1,172 @@
+import errno
+import socket
+import struct
+import time
+import numpy as np
+from typing import Dict, List, Tuple
+from .view_state import ViewState, BUFFER_SIZE
+
+# Wire format of a view message: magic, version, sender id, sequence number, send time, then the packed view state
+# buffer. Every message has the same size and is sent in a single UDP datagram.
+WIRE_MAGIC = b"SYNV"
+WIRE_VERSION = 1
+WIRE_HEADER = struct.Struct("<4sB3xI4xQd")
+WIRE_SIZE = WIRE_HEADER.size + BUFFER_SIZE * 8
+
+DEFAULT_PORT = 27450
+LOCALHOST = "127.0.0.1"
+
+
+def parse_peers(peers: str) -> List[Tuple[str, int]]:
+    """
+    Parse a comma separated list of peers, each either a port on localhost or host:port
+
+    Args:
+        peers (str): peers as entered in the addon preferences, e.g. "27451, 127.0.0.1:27452"
+
+    Returns:
+        List[Tuple[str, int]]: socket addresses of the peers
+
+    Raises:
+        ValueError: if a peer is not a valid port or host:port
+    """
+    addresses = []
+    for peer in peers.split(","):
+        peer = peer.strip()
+        if not peer:
+            continue
+        host, _, port = peer.rpartition(":")
+        port = int(port)
+        if not 0 < port < 65536:
+            raise ValueError("Port %d of peer '%s' is out of range" % (port, peer))
+        addresses.append((host or LOCALHOST, port))
+    return addresses
+
+
+def resolve_peers(peers: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+    """
+    Resolve the host names of peers to IPv4 addresses, so sending a view doesn't look them up every time
+
+    Args:
+        peers (List[Tuple[str, int]]): addresses as returned by parse_peers()
+
+    Returns:
+        List[Tuple[str, int]]: socket addresses with numeric hosts
+
+    Raises:
+        OSError: if a host name can't be resolved
+    """
+    return [socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)[0][4][:2] for host, port in peers]
+
+
+class ViewTransport:
+    """
+    Sends view states to other Blender instances and receives theirs, over UDP.
+
+    Messages have a fixed size and carry a sequence number, the receiver only keeps the newest message of each
+    sender and drops older ones that arrive out of order, so a slow receiver skips views instead of falling behind.
+    Both directions reuse preallocated message buffers.
+    """
+
+    def __init__(self, port: int = DEFAULT_PORT, peers: List[Tuple[str, int]] = (), host: str = LOCALHOST):
+        """
+        Args:
+            port (int): port to receive views on
+            peers (List[Tuple[str, int]]): addresses to send views to, with numeric hosts as returned by
+                resolve_peers()
+            host (str): address to receive views on
+
+        Raises:
+            OSError: if the socket can't be bound, e.g. because another instance uses the port
+        """
+        self.peers: List[Tuple[str, int]] = list(peers)
+        self.port: int = port
+        self._socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._socket.bind((host, port))
+        except OSError:
+            self._socket.close()
+            raise
+        self._socket.setblocking(False)
+        # Random per instance, so restarted senders aren't mistaken for old messages and own messages are ignored
+        self.sender_id: int = int.from_bytes(np.random.bytes(4), "little")
+        self._sequence: int = 0
+        self._send_message: bytearray = bytearray(WIRE_SIZE)
+        self._send_values: np.ndarray = np.frombuffer(self._send_message, dtype="<f8", offset=WIRE_HEADER.size)
+        # One byte larger than a message, so longer datagrams are detected instead of silently truncated
+        self._receive_message: bytearray = bytearray(WIRE_SIZE + 1)
+        self._receive_view: memoryview = memoryview(self._receive_message)
+        self._receive_values: np.ndarray = np.frombuffer(self._receive_message, dtype="<f8", count=BUFFER_SIZE,
+                                                          offset=WIRE_HEADER.size)
+        # Newest sequence number received from each sender {sender id : sequence}
+        self._sequences: Dict[int, int] = dict()
+        self.packets_sent: int = 0
+        self.packets_received: int = 0
+        self.packets_dropped: int = 0
+        # Seconds between sending and receiving the last applied message
+        self.last_latency: float = 0.0
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Address the socket is bound to, which holds the actual port if it was created with port 0"""
+        return self._socket.getsockname()
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def publish(self, view_state: ViewState) -> None:
+        """
+        Send a view state to every peer
+
+        Args:
+            view_state (ViewState): view to send
+        """
+        self._sequence += 1
+        WIRE_HEADER.pack_into(self._send_message, 0, WIRE_MAGIC, WIRE_VERSION, self.sender_id, self._sequence,
+                              time.time())
+        np.copyto(self._send_values, view_state.buffer)
+        for peer in self.peers:
+            try:
+                self._socket.sendto(self._send_message, peer)
+            except OSError:
+                # Peers that are not running refuse the message, they'll get the next view once they are
+                continue
+            self.packets_sent += 1
+
+    def receive(self, view_state: ViewState) -> bool:
+        """
+        Read every message waiting on the socket and keep the newest one
+
+        Args:
+            view_state (ViewState): filled with the newest received view, left untouched if there is none
+
+        Returns:
+            bool: whether a new view was received
+        """
+        received = False
+        while True:
+            try:
+                size = self._socket.recv_into(self._receive_view)
+            except BlockingIOError:
+                break
+            except OSError as error:
+                # Windows reports refused sends to closed peers on the next receive
+                if error.errno in (errno.ECONNRESET, getattr(errno, "WSAECONNRESET", None)):
+                    continue
+                raise
+            if size != WIRE_SIZE:
+                self.packets_dropped += 1
+                continue
+            magic, version, sender_id, sequence, sent = WIRE_HEADER.unpack_from(self._receive_message)
+            if magic != WIRE_MAGIC or version != WIRE_VERSION or sender_id == self.sender_id:
+                self.packets_dropped += 1
+                continue
+            if sequence <= self._sequences.get(sender_id, 0):
+                self.packets_dropped += 1
+                continue
+            self._sequences[sender_id] = sequence
+            self.packets_received += 1
+            self.last_latency = time.time() - sent
+            np.copyto(view_state.buffer, self._receive_values)
+            received = True
+        return received
@@ -1,5 +1,8 @@
 import bpy
+from bpy.props import EnumProperty, StringProperty
 from .utils import registration
+from .utils.viewports import (get_viewport_setting, set_viewport_setting, find_area_index, PRIORITY_HIGH, PRIORITY_LOW,
+                              DEFAULT_CHANNEL)
 
 
 def viewport_sync_button(self, context):
@@ -10,6 +13,40 @@ def viewport_sync_button(self, context):
         layout.prop(view_region, "show_sync_view", text="", icon_only=True, icon="UV_SYNC_SELECT")
 
 
+def get_context_viewport_setting(name, default):
+    context = bpy.context
+    area_index = find_area_index(context.screen, context.space_data) if context.space_data else -1
+    if area_index < 0:
+        return default
+    return get_viewport_setting(context.screen, area_index, name, default)
+
+
+def set_context_viewport_setting(name, value):
+    context = bpy.context
+    area_index = find_area_index(context.screen, context.space_data) if context.space_data else -1
+    if area_index < 0:
+        return
+    set_viewport_setting(context.screen, area_index, name, value)
+    if 'sync_view' in bpy.app.driver_namespace:
+        bpy.app.driver_namespace['sync_view'].refresh_viewport_settings()
+
+
+def get_viewport_priority(self):
+    return get_context_viewport_setting("priority", PRIORITY_HIGH)
+
+
+def set_viewport_priority(self, value):
+    set_context_viewport_setting("priority", value)
+
+
+def get_viewport_channel(self):
+    return get_context_viewport_setting("channel", DEFAULT_CHANNEL)
+
+
+def set_viewport_channel(self, value):
+    set_context_viewport_setting("channel", value.strip())
+
+
 class SyncViewPanel(bpy.types.Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
@@ -28,6 +65,10 @@ class SYNC_VIEW_VIEW3D_PT_setting_panel(SyncViewPanel):
         # Disable if in quadview
         if len(context.space_data.region_quadviews) <= 1:
             layout.prop(view_region, "show_sync_view", text="Sync This Viewport", icon_only=True, icon="UV_SYNC_SELECT")
+            layout.prop(context.window_manager, "sync_view_channel", icon='LINKED')
+            row = layout.row()
+            row.active = preferences.use_frame_budget
+            row.prop(context.window_manager, "sync_view_priority", expand=True)
 
         layout.label(text="Shortcuts")
         layout.operator(operator="syncview.sync_all_visible")
@@ -38,6 +79,48 @@ class SYNC_VIEW_VIEW3D_PT_setting_panel(SyncViewPanel):
         column.prop(preferences, "pause_sync", icon='PAUSE')
         column.prop(preferences, "sync_playback", icon='PLAY')
         column.prop(preferences, "sync_camera_view", icon='VIEW_CAMERA')
+        row = column.row()
+        row.active = preferences.sync_camera_view
+        row.prop(preferences, "camera_sync_mode", text="")
+        sub_column = column.column(align=True)
+        sub_column.active = preferences.sync_playback
+        sub_column.prop(preferences, "use_playback_decimation", icon='NEXT_KEYFRAME')
+        row = sub_column.row(align=True)
+        row.active = preferences.use_playback_decimation
+        row.prop(preferences, "playback_decimation_mode", text="")
+        if preferences.playback_decimation_mode == "RATE":
+            row.prop(preferences, "playback_rate")
+        else:
+            row.prop(preferences, "playback_frame_step")
+        column.prop(preferences, "use_sync_scheduler", icon='TIME')
+        row = column.row()
+        row.active = preferences.use_sync_scheduler
+        row.prop(preferences, "sync_rate")
+        column.prop(preferences, "use_transport", icon='LINKED')
+        row = column.row(align=True)
+        row.active = preferences.use_transport
+        row.prop(preferences, "transport_port")
+        row.prop(preferences, "transport_peers", text="")
+        column.prop(preferences, "use_change_threshold", icon='DRIVER_DISTANCE')
+        row = column.row(align=True)
+        row.active = preferences.use_change_threshold
+        row.prop(preferences, "change_threshold_angle")
+        row.prop(preferences, "change_threshold_distance")
+        column.prop(preferences, "use_frame_budget", icon='SORTTIME')
+        row = column.row()
+        row.active = preferences.use_frame_budget
+        row.prop(preferences, "frame_budget_ms")
+        column.prop(preferences, "use_event_detection", icon='VIEW_PAN')
+        row = column.row(align=True)
+        row.active = preferences.use_event_detection
+        row.prop(preferences, "event_stable_draws")
+        row.prop(preferences, "event_poll_interval")
+        column.prop(preferences, "use_navigation_lod", icon='MOD_DECIM')
+        column = column.column()
+        column.active = preferences.use_navigation_lod
+        column.prop(preferences, "navigation_lod_shading", text="")
+        column.prop(preferences, "navigation_lod_hide_overlays")
+        column.prop(preferences, "navigation_lod_idle_time")
 
 
 class SYNC_VIEW_VIEW3D_PT_sync_mode_panel(SyncViewPanel):
@@ -54,10 +137,83 @@ class SYNC_VIEW_VIEW3D_PT_sync_mode_panel(SyncViewPanel):
         box.props_enum(preferences, "sync_mode")
 
 
-ui = [SYNC_VIEW_VIEW3D_PT_setting_panel, SYNC_VIEW_VIEW3D_PT_sync_mode_panel]
+class SYNC_VIEW_VIEW3D_PT_profiling_panel(SyncViewPanel):
+    """Timings of the sync draw callback"""
+    bl_label = "Profiling"
+    bl_parent_id = "SYNC_VIEW_VIEW3D_PT_setting_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        preferences = bpy.context.preferences.addons[__package__].preferences
+        layout.prop(preferences, "enable_profiling", icon='TIME')
+
+        sync_view = bpy.app.driver_namespace.get('sync_view')
+        if sync_view:
+            layout.label(text="Suppressed Redraw Callbacks: %d" % sync_view.suppressed_callbacks)
+            layout.label(text="Evicted Spaces: %d" % sync_view.evicted_spaces)
+            transport = sync_view.transport
+            if transport is not None:
+                layout.label(text="Instances: %d sent  %d received  %d dropped  %.1f ms latency" % (
+                    transport.packets_sent, transport.packets_received, transport.packets_dropped,
+                    transport.last_latency * 1e3))
+            row = layout.row()
+            recorder = sync_view.recorder
+            if recorder is None:
+                row.operator(operator="syncview.start_trace", icon='REC')
+            else:
+                row.operator(operator="syncview.stop_trace", icon='CANCEL')
+                row.label(text="Trace Events: %d" % recorder.event_count)
+        stats = sync_view.stats if sync_view else None
+        if stats is None:
+            return
+
+        column = layout.column(align=True)
+        column.label(text="Calls: %d  Syncs: %d" % (stats.calls, stats.syncs))
+        column.label(text="Targets Written: %d  Attributes: %d" % (stats.targets_written, stats.attributes_written))
+        column.label(text="Targets Deferred (hidden): %d" % stats.targets_deferred)
+        column.label(text="Targets Postponed (budget): %d" % stats.targets_postponed)
+        for reason, count in sorted(stats.skips.items()):
+            column.label(text="Skipped (%s): %d" % (reason.replace("_", " "), count))
+
+        box = layout.box()
+        grid = box.grid_flow(row_major=True, columns=4, even_columns=False, align=True)
+        for heading in ("Phase", "Mean", "P95", "Max"):
+            grid.label(text=heading)
+        for phase, timings in stats.phases.items():
+            summary = timings.summary()
+            grid.label(text=phase.replace("_", " ").title())
+            for key in ("mean_us", "p95_us", "max_us"):
+                grid.label(text="%.1f us" % summary[key])
+
+        row = layout.row()
+        row.operator(operator="syncview.export_profile", icon='EXPORT')
+        row.operator(operator="syncview.reset_profile", icon='TRASH')
+
+
+ui = [SYNC_VIEW_VIEW3D_PT_setting_panel, SYNC_VIEW_VIEW3D_PT_sync_mode_panel, SYNC_VIEW_VIEW3D_PT_profiling_panel]
 
 
 def register():
+    # Priority of the viewport the UI is drawn in, stored in its screen's viewport settings
+    bpy.types.WindowManager.sync_view_priority = EnumProperty(
+        name="Sync Priority",
+        items=[
+            ("HIGH", "High Priority", "Update this viewport on every change", 'TRIA_UP', PRIORITY_HIGH),
+            ("LOW", "Low Priority", "Update this viewport within the frame budget, it may lag behind while "
+                                    "navigating", 'TRIA_DOWN', PRIORITY_LOW),
+        ],
+        description="How this viewport is updated when the frame budget is enabled",
+        get=get_viewport_priority,
+        set=set_viewport_priority,
+    )
+    # Sync channel of the viewport the UI is drawn in, stored in its screen's viewport settings
+    bpy.types.WindowManager.sync_view_channel = StringProperty(
+        name="Channel",
+        description="Viewports only sync with viewports in the same channel, leave empty for the default channel",
+        get=get_viewport_channel,
+        set=set_viewport_channel,
+    )
     bpy.types.VIEW3D_HT_header.append(viewport_sync_button)
     registration.register_classes(ui)
 
@@ -65,3 +221,5 @@ def register():
 def unregister():
     bpy.types.VIEW3D_HT_header.remove(viewport_sync_button)
     registration.unregister_classes(ui)
+    del bpy.types.WindowManager.sync_view_priority
+    del bpy.types.WindowManager.sync_view_channel
@@ -0,0 +1,86 @@
+import bpy
+
+
+def any_viewport_tagged() -> bool:
+    """
+    Check every screen in the blend file for a 3D viewport that is tagged for sync.
+    This only touches RNA, so it can be called without importing the sync handler.
+
+    Returns:
+        bool: whether any 3D viewport is tagged for sync
+    """
+    for screen in bpy.context.blend_data.screens:
+        for area in screen.areas:
+            if area.type == 'VIEW_3D':
+                region_3d = area.spaces.active.region_3d
+                if region_3d and region_3d.show_sync_view:
+                    return True
+    return False
+
+
+# Per-viewport settings are stored on the screen, like the "sync_view.do_not_sync" tag, since RegionView3D
+# can't hold custom properties. They're keyed by the index of the viewport's area in screen.areas.
+VIEWPORT_SETTINGS_KEY = "sync_view.viewports"
+# Closing, splitting or joining areas shifts area indices, so the settings of each area are stored along with the
+# number of areas in the screen, and are dropped once that number changed
+AREA_COUNT_KEY = "area_count"
+
+# Viewports only sync with viewports in the same channel, untouched viewports are in the default channel
+DEFAULT_CHANNEL = ""
+
+# Sync priorities, high priority viewports are updated on every change, low priority ones within the frame budget
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 1
+
+
+def get_viewport_setting(screen: bpy.types.Screen, area_index: int, name: str, default):
+    """
+    Read a setting of the viewport in the given area of a screen
+
+    Args:
+        screen (bpy.types.Screen): screen the viewport is in
+        area_index (int): index of the viewport's area in screen.areas
+        name (str): name of the setting
+        default: value of settings that were never set
+
+    Returns:
+        The value of the setting
+    """
+    settings = screen.get(VIEWPORT_SETTINGS_KEY)
+    if settings is None:
+        return default
+    area_settings = settings.get(str(area_index))
+    if area_settings is None or area_settings.get(AREA_COUNT_KEY) != len(screen.areas):
+        return default
+    return area_settings.get(name, default)
+
+
+def set_viewport_setting(screen: bpy.types.Screen, area_index: int, name: str, value) -> None:
+    """
+    Write a setting of the viewport in the given area of a screen
+
+    Args:
+        screen (bpy.types.Screen): screen the viewport is in
+        area_index (int): index of the viewport's area in screen.areas
+        name (str): name of the setting
+        value: new value of the setting
+    """
+    if VIEWPORT_SETTINGS_KEY not in screen:
+        screen[VIEWPORT_SETTINGS_KEY] = {}
+    settings = screen[VIEWPORT_SETTINGS_KEY]
+    area_count = len(screen.areas)
+    for key in [key for key, area_settings in settings.items() if area_settings.get(AREA_COUNT_KEY) != area_count]:
+        del settings[key]
+    if str(area_index) not in settings:
+        settings[str(area_index)] = {AREA_COUNT_KEY: area_count}
+    settings[str(area_index)][name] = value
+
+
+def find_area_index(screen: bpy.types.Screen, space: bpy.types.Space) -> int:
+    """
+    Returns the index in screen.areas of the area whose active space is the given space, or -1 if there is none
+    """
+    for index, area in enumerate(screen.areas):
+        if area.spaces.active == space:
+            return index
+    return -1
@@ -0,0 +1,275 @@
+import bpy
+import math
+import numpy as np
+from operator import itemgetter
+from typing import NamedTuple, Tuple, Union
+
+# Attributes written to synced viewports, in the order of ViewPacket's values
+SPACE_ATTRIBUTES = ["clip_end", "clip_start", "lens"]
+VIEW_REGION_3D_ATTRIBUTES = ["clip_planes", "is_orthographic_side_view", "is_perspective", "lock_rotation", "use_box_clip", "use_clip_planes",
+                             "view_camera_offset", "view_camera_zoom", "view_distance", "view_location", "view_perspective", "view_rotation"]
+
+# Layout of the packed view state buffer
+LENS = 0
+CLIP_START = 1
+CLIP_END = 2
+VIEW_CAMERA_ZOOM = 3
+VIEW_DISTANCE = 4
+FLAGS = 5
+VIEW_CAMERA_OFFSET = slice(6, 8)
+VIEW_LOCATION = slice(8, 11)
+VIEW_ROTATION = slice(11, 15)
+CLIP_PLANES = slice(15, 31)
+VIEW_MATRIX = slice(31, 47)
+BUFFER_SIZE = 47
+
+# Bits of the flags word, the view perspective enum is stored above the boolean flags
+FLAG_IS_ORTHOGRAPHIC_SIDE_VIEW = 1 << 0
+FLAG_IS_PERSPECTIVE = 1 << 1
+FLAG_LOCK_ROTATION = 1 << 2
+FLAG_USE_BOX_CLIP = 1 << 3
+FLAG_USE_CLIP_PLANES = 1 << 4
+VIEW_PERSPECTIVE_SHIFT = 5
+
+VIEW_PERSPECTIVES = ("PERSP", "ORTHO", "CAMERA")
+VIEW_PERSPECTIVE_INDEX = {perspective: index for index, perspective in enumerate(VIEW_PERSPECTIVES)}
+
+# Getters that build each tuple of a ViewPacket straight from the buffer's values, without slicing lists first
+_get_space_values = itemgetter(CLIP_END, CLIP_START, LENS)
+_get_view_camera_offset = itemgetter(*range(VIEW_CAMERA_OFFSET.start, VIEW_CAMERA_OFFSET.stop))
+_get_view_location = itemgetter(*range(VIEW_LOCATION.start, VIEW_LOCATION.stop))
+_get_view_rotation = itemgetter(*range(VIEW_ROTATION.start, VIEW_ROTATION.stop))
+_get_clip_planes = tuple(itemgetter(*range(row, row + 4)) for row in range(CLIP_PLANES.start, CLIP_PLANES.stop, 4))
+_get_view_matrix = tuple(itemgetter(*range(row, row + 4)) for row in range(VIEW_MATRIX.start, VIEW_MATRIX.stop, 4))
+
+
+def _copy_matrix(rows: Tuple[memoryview, ...], matrix) -> None:
+    """Write a 4x4 matrix into the memoryviews of its rows element by element, so no temporary array is built"""
+    row_0, row_1, row_2, row_3 = rows
+    values_0, values_1, values_2, values_3 = matrix
+    row_0[0], row_0[1], row_0[2], row_0[3] = values_0
+    row_1[0], row_1[1], row_1[2], row_1[3] = values_1
+    row_2[0], row_2[1], row_2[2], row_2[3] = values_2
+    row_3[0], row_3[1], row_3[2], row_3[3] = values_3
+
+
+class ViewState:
+    """
+    The view of a 3D viewport packed into a single preallocated float buffer.
+
+    capture() fills the buffer in place, so checking a viewport for changes costs the RNA reads
+    plus one typed comparison of two buffers instead of one comparison (and array allocation) per attribute.
+    Vectors and matrices are written through memoryviews of the buffer one element at a time, since assigning
+    a sequence to a numpy slice converts it to a temporary array first.
+    """
+    __slots__ = ("buffer", "_buffer_view", "_view_camera_offset", "_view_location", "_view_rotation",
+                 "_clip_planes", "_view_matrix")
+
+    def __init__(self):
+        self.buffer: np.ndarray = np.zeros(BUFFER_SIZE, dtype=np.float64)
+        # Comparing memoryviews of the same native format is a typed element-wise compare without temporaries
+        self._buffer_view: memoryview = memoryview(self.buffer)
+        self._view_camera_offset: memoryview = self._buffer_view[VIEW_CAMERA_OFFSET]
+        self._view_location: memoryview = self._buffer_view[VIEW_LOCATION]
+        self._view_rotation: memoryview = self._buffer_view[VIEW_ROTATION]
+        self._clip_planes: Tuple[memoryview, ...] = tuple(
+            self._buffer_view[row:row + 4] for row in range(CLIP_PLANES.start, CLIP_PLANES.stop, 4))
+        self._view_matrix: Tuple[memoryview, ...] = tuple(
+            self._buffer_view[row:row + 4] for row in range(VIEW_MATRIX.start, VIEW_MATRIX.stop, 4))
+
+    def capture(self, space: bpy.types.Space) -> None:
+        """
+        Fill the buffer in place with the view of the given space
+
+        Args:
+            space (bpy.types.Space): space to read the view from
+        """
+        region_3d = space.region_3d
+        buffer = self.buffer
+
+        buffer[LENS] = space.lens
+        buffer[CLIP_START] = space.clip_start
+        buffer[CLIP_END] = space.clip_end
+        buffer[VIEW_CAMERA_ZOOM] = region_3d.view_camera_zoom
+        buffer[VIEW_DISTANCE] = region_3d.view_distance
+
+        flags = VIEW_PERSPECTIVE_INDEX.get(region_3d.view_perspective, 0) << VIEW_PERSPECTIVE_SHIFT
+        if region_3d.is_orthographic_side_view:
+            flags |= FLAG_IS_ORTHOGRAPHIC_SIDE_VIEW
+        if region_3d.is_perspective:
+            flags |= FLAG_IS_PERSPECTIVE
+        if region_3d.lock_rotation:
+            flags |= FLAG_LOCK_ROTATION
+        if region_3d.use_box_clip:
+            flags |= FLAG_USE_BOX_CLIP
+        if region_3d.use_clip_planes:
+            flags |= FLAG_USE_CLIP_PLANES
+        buffer[FLAGS] = flags
+
+        view_camera_offset = self._view_camera_offset
+        view_camera_offset[0], view_camera_offset[1] = region_3d.view_camera_offset
+        view_location = self._view_location
+        view_location[0], view_location[1], view_location[2] = region_3d.view_location
+        view_rotation = self._view_rotation
+        view_rotation[0], view_rotation[1], view_rotation[2], view_rotation[3] = region_3d.view_rotation
+        _copy_matrix(self._clip_planes, region_3d.clip_planes)
+        _copy_matrix(self._view_matrix, region_3d.view_matrix)
+
+    def capture_framing(self, space: bpy.types.Space) -> None:
+        """
+        Fill only the camera framing of the given space in place: the camera zoom and offset, and the view matrix,
+        which follows the scene camera. The rest of the buffer keeps its previous values.
+
+        Args:
+            space (bpy.types.Space): space in camera view to read the framing from
+        """
+        region_3d = space.region_3d
+        self.buffer[VIEW_CAMERA_ZOOM] = region_3d.view_camera_zoom
+        view_camera_offset = self._view_camera_offset
+        view_camera_offset[0], view_camera_offset[1] = region_3d.view_camera_offset
+        _copy_matrix(self._view_matrix, region_3d.view_matrix)
+
+    def matches(self, other: "ViewState") -> bool:
+        """
+        Returns if this view state is exactly equal to another one
+
+        Args:
+            other (ViewState): view state to compare against
+
+        Returns:
+            bool: If both buffers hold the same values
+        """
+        return self._buffer_view == other._buffer_view
+
+    def matches_framing(self, other: "ViewState") -> bool:
+        """
+        Returns if the camera framing captured by capture_framing() is exactly equal to another one
+
+        Args:
+            other (ViewState): view state to compare against
+
+        Returns:
+            bool: If both buffers hold the same camera zoom, camera offset and view matrix
+        """
+        view, other_view = self._buffer_view, other._buffer_view
+        return (view[VIEW_CAMERA_ZOOM] == other_view[VIEW_CAMERA_ZOOM]
+                and view[VIEW_CAMERA_OFFSET] == other_view[VIEW_CAMERA_OFFSET]
+                and view[VIEW_MATRIX] == other_view[VIEW_MATRIX])
+
+    def within_threshold(self, other: "ViewState", angle: float, distance: float) -> bool:
+        """
+        Returns if this view differs from another one by less than the given thresholds. Only the rotation,
+        location and distance are compared with thresholds, every other value must be exactly equal.
+        The view matrix is derived from those three, so it's not compared.
+
+        Args:
+            other (ViewState): view state to compare against
+            angle (float): largest rotation in radians that is within the threshold
+            distance (float): largest move of the view location or distance, as a fraction of other's view distance
+
+        Returns:
+            bool: If the views only differ by changes smaller than the thresholds
+        """
+        view, other_view = self._buffer_view, other._buffer_view
+        if (view[:VIEW_DISTANCE] != other_view[:VIEW_DISTANCE] or view[FLAGS] != other_view[FLAGS]
+                or view[VIEW_CAMERA_OFFSET] != other_view[VIEW_CAMERA_OFFSET]
+                or view[CLIP_PLANES] != other_view[CLIP_PLANES]):
+            return False
+
+        limit = distance * other_view[VIEW_DISTANCE]
+        if abs(view[VIEW_DISTANCE] - other_view[VIEW_DISTANCE]) > limit:
+            return False
+        x, y, z = VIEW_LOCATION.start, VIEW_LOCATION.start + 1, VIEW_LOCATION.start + 2
+        if ((view[x] - other_view[x]) ** 2 + (view[y] - other_view[y]) ** 2 +
+                (view[z] - other_view[z]) ** 2) > limit * limit:
+            return False
+
+        # q and -q are the same rotation, the angle between two rotations is 2 * acos(|q1 . q2|)
+        w, x, y, z = range(VIEW_ROTATION.start, VIEW_ROTATION.stop)
+        dot = abs(view[w] * other_view[w] + view[x] * other_view[x] + view[y] * other_view[y] +
+                  view[z] * other_view[z])
+        return dot >= math.cos(angle * 0.5)
+
+    def copy_from(self, other: "ViewState") -> None:
+        """
+        Overwrite this view state with the values of another one, without reallocating the buffer
+
+        Args:
+            other (ViewState): view state to copy from
+        """
+        np.copyto(self.buffer, other.buffer)
+
+
+class ViewPacket(NamedTuple):
+    """
+    An immutable copy of a view, captured once per change and applied to every target viewport.
+    Values are plain Python objects in the order of SPACE_ATTRIBUTES and VIEW_REGION_3D_ATTRIBUTES.
+    """
+    space_values: Tuple[object, ...]
+    region_3d_values: Tuple[object, ...]
+
+    @classmethod
+    def from_view_state(cls, view_state: ViewState) -> "ViewPacket":
+        """
+        Create a packet from an already captured view state, without reading the source space again
+
+        Args:
+            view_state (ViewState): captured view state
+
+        Returns:
+            ViewPacket: packet holding the same view
+        """
+        values = view_state._buffer_view
+        flags = int(values[FLAGS])
+        return cls(
+            _get_space_values(values),
+            (
+                (_get_clip_planes[0](values), _get_clip_planes[1](values), _get_clip_planes[2](values),
+                 _get_clip_planes[3](values)),
+                bool(flags & FLAG_IS_ORTHOGRAPHIC_SIDE_VIEW),
+                bool(flags & FLAG_IS_PERSPECTIVE),
+                bool(flags & FLAG_LOCK_ROTATION),
+                bool(flags & FLAG_USE_BOX_CLIP),
+                bool(flags & FLAG_USE_CLIP_PLANES),
+                _get_view_camera_offset(values),
+                values[VIEW_CAMERA_ZOOM],
+                values[VIEW_DISTANCE],
+                _get_view_location(values),
+                VIEW_PERSPECTIVES[flags >> VIEW_PERSPECTIVE_SHIFT],
+                _get_view_rotation(values),
+            )
+        )
+
+
+class FramingPacket(NamedTuple):
+    """
+    The camera framing of a view in camera view, applied to targets instead of a ViewPacket when only the framing
+    is synced. Targets in camera view get the camera zoom and offset, other targets follow the camera through
+    the view matrix.
+    """
+    view_camera_zoom: float
+    view_camera_offset: Tuple[float, float]
+    view_matrix: Tuple[Tuple[float, float, float, float], ...]
+
+    @classmethod
+    def from_view_state(cls, view_state: ViewState) -> "FramingPacket":
+        """
+        Create a packet from a view state filled by capture_framing()
+
+        Args:
+            view_state (ViewState): captured view state
+
+        Returns:
+            FramingPacket: packet holding the same framing
+        """
+        values = view_state._buffer_view
+        return cls(
+            values[VIEW_CAMERA_ZOOM],
+            _get_view_camera_offset(values),
+            (_get_view_matrix[0](values), _get_view_matrix[1](values), _get_view_matrix[2](values),
+             _get_view_matrix[3](values)),
+        )
+
+
+# Either kind of packet, as queued for and applied to targets
+Packet = Union[ViewPacket, FramingPacket]